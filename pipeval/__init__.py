@@ -4,16 +4,20 @@
 __version__ = "0.1.0"
 
 from .core import Schema, Field
+from .routing import SchemaRouter
 from .types import DataType, ValidationResult, ValidationError
 from .validators import Validators
 from .readers import FileReader
+from .writers import FileWriter
 
 __all__ = [
     "Schema",
+    "SchemaRouter",
     "Field",
     "DataType",
     "ValidationResult",
     "ValidationError",
     "Validators",
-    "FileReader"
+    "FileReader",
+    "FileWriter",
 ]
\ No newline at end of file
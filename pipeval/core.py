@@ -1,7 +1,120 @@
 """Core validation engine."""
 
-from typing import Any, Dict, List, Optional, Callable
+import asyncio
+import copy
+import time
+from typing import Any, AsyncIterable, Dict, List, Optional, Callable, Union
 from .types import DataType, ValidationError, ValidationResult
+from .profiling import Profile
+from .instrumentation import Instrumentation, measure
+
+
+class AdaptiveOrder:
+    """Reorders a field's validators by measured cost and failure rate.
+    
+    Validators short-circuit on the first failure, so the expected cost of
+    a row is minimized by running them in ascending order of
+    ``cost / failure_rate``. Timings are taken on the first ``warmup``
+    calls and then on one call in ``sample_every``; the order is
+    recomputed every ``reorder_every`` calls.
+    
+    With ``exact_errors`` (the default) a failing value also runs any
+    skipped validator declared before the one that failed, so the reported
+    error always matches the declared order. Since that has to confirm
+    every earlier validator passes, the savings come when ``exact_errors``
+    is disabled and any failure is an acceptable answer.
+    """
+    
+    def __init__(
+        self,
+        validators: List[Callable],
+        warmup: int = 64,
+        sample_every: int = 16,
+        reorder_every: int = 256,
+        exact_errors: bool = True
+    ):
+        self.validators = list(validators)
+        self.exact_errors = exact_errors
+        self.warmup = warmup
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self.order = list(range(len(self.validators)))
+        self.calls = 0
+        n = len(self.validators)
+        self._cost = [0.0] * n
+        self._timed = [0] * n
+        self._runs = [0] * n
+        self._fails = [0] * n
+    
+    def check(self, value: Any) -> tuple:
+        """Run validators in the current order.
+        
+        When a validator fails and ``exact_errors`` is set, any validator
+        declared before it that was skipped is run as well, so the reported
+        error is always the one the declared order would have produced.
+        
+        Returns:
+            (is_valid, error_message)
+        """
+        self.calls += 1
+        timing = self.calls <= self.warmup or self.calls % self.sample_every == 0
+        result = (True, None)
+        # reorder() swaps in a new list, so this snapshot stays complete
+        # even if another thread reorders while we iterate
+        order = self.order
+        
+        for position, i in enumerate(order):
+            validator = self.validators[i]
+            if timing:
+                start = time.perf_counter()
+                is_valid, error_msg = validator(value)
+                self._cost[i] += time.perf_counter() - start
+                self._timed[i] += 1
+            else:
+                is_valid, error_msg = validator(value)
+            self._runs[i] += 1
+            if not is_valid:
+                self._fails[i] += 1
+                skipped = set(order[position + 1:])
+                result = (False, error_msg)
+                if not self.exact_errors:
+                    break
+                for j in range(i):
+                    if j in skipped:
+                        is_valid, error_msg = self.validators[j](value)
+                        if not is_valid:
+                            result = (False, error_msg)
+                            break
+                break
+        
+        if self.calls % self.reorder_every == 0:
+            self.reorder()
+        return result
+    
+    def reorder(self) -> None:
+        """Recompute the order from the statistics gathered so far."""
+        # Sort a copy: list.sort() empties the list while keys are computed,
+        # which a concurrent check() would see as having no validators
+        self.order = sorted(self.order, key=self._rank)
+    
+    def _rank(self, i: int) -> tuple:
+        # Laplace smoothing keeps rarely-run validators from ranking at 0 or inf
+        cost = self._cost[i] / self._timed[i] if self._timed[i] else 0.0
+        failure_rate = (self._fails[i] + 1) / (self._runs[i] + 2)
+        return (cost / failure_rate, i)
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-validator statistics in declaration order."""
+        return [
+            {
+                "index": i,
+                "position": self.order.index(i),
+                "runs": self._runs[i],
+                "failures": self._fails[i],
+                "avg_cost": self._cost[i] / self._timed[i] if self._timed[i] else None,
+            }
+            for i in range(len(self.validators))
+        ]
 
 
 class Field:
@@ -13,13 +126,18 @@ class Field:
         data_type: DataType,
         required: bool = False,
         validators: Optional[List[Callable]] = None,
-        default: Any = None
+        default: Any = None,
+        adaptive: bool = False,
+        exact_errors: bool = True
     ):
         self.name = name
         self.data_type = data_type
         self.required = required
         self.validators = validators or []
         self.default = default
+        self.adaptive = adaptive
+        self.exact_errors = exact_errors
+        self._adaptive_order: Optional[AdaptiveOrder] = None
     
     def validate(self, value: Any, row: Optional[int] = None) -> tuple:
         """Validate a value for this field.
@@ -27,25 +145,61 @@ class Field:
         Returns:
             (is_valid, error_message, converted_value)
         """
-        # Handle missing values
+        is_valid, error_msg, converted, needs_check = self.convert(value)
+        if not needs_check:
+            return is_valid, error_msg, converted
+        
+        # Run custom validators
+        is_valid, error_msg = self.check(converted)
+        if not is_valid:
+            return False, error_msg, None
+        
+        return True, None, converted
+    
+    def convert(self, value: Any) -> tuple:
+        """Handle missing values and convert type, without running validators.
+        
+        Returns:
+            (is_valid, error_message, converted_value, needs_check); validators
+            should only run on the converted value when needs_check is True
+        """
         if value is None or value == "":
             if self.required:
-                return False, "Required field", None
-            return True, None, self.default
+                return False, "Required field", None, False
+            return True, None, self.default, False
         
-        # Type checking and conversion
         try:
-            converted = self._convert_type(value)
+            return True, None, self._convert_type(value), True
         except ValueError as e:
-            return False, str(e), None
+            return False, str(e), None, False
+    
+    def check(self, converted: Any) -> tuple:
+        """Run this field's validators on an already converted value.
+        
+        Returns:
+            (is_valid, error_message)
+        """
+        if self.adaptive and len(self.validators) > 1:
+            return self.adaptive_order.check(converted)
         
-        # Run custom validators
         for validator in self.validators:
             is_valid, error_msg = validator(converted)
             if not is_valid:
-                return False, error_msg, None
+                return False, error_msg
         
-        return True, None, converted
+        return True, None
+    
+    @property
+    def adaptive_order(self) -> AdaptiveOrder:
+        """Validator ordering state used when ``adaptive`` is enabled."""
+        if (
+            self._adaptive_order is None
+            or self._adaptive_order.validators != self.validators
+        ):
+            self._adaptive_order = AdaptiveOrder(
+                self.validators, exact_errors=self.exact_errors
+            )
+        return self._adaptive_order
     
     def _convert_type(self, value: Any) -> Any:
         """Convert value to expected type."""
@@ -66,10 +220,23 @@ class Field:
         return value
 
 
+def _adaptive_copy(field: Field) -> Field:
+    if field.adaptive:
+        return field
+    adaptive = copy.copy(field)
+    adaptive.adaptive = True
+    adaptive._adaptive_order = None
+    return adaptive
+
+
 class Schema:
     """Defines the structure and validation rules for data."""
     
-    def __init__(self, fields: List[Field]):
+    def __init__(self, fields: List[Field], adaptive: bool = False):
+        if adaptive:
+            # Adaptive copies keep their own ordering state and leave the
+            # caller's fields, which other schemas may share, untouched
+            fields = [_adaptive_copy(field) for field in fields]
         self.fields = fields
         self.field_map = {f.name: f for f in fields}
     
@@ -104,27 +271,165 @@ class Schema:
     
     def validate_batch(
         self, 
-        records: List[Dict[str, Any]]
+        records: List[Dict[str, Any]],
+        profile: bool = False,
+        instrument: Union[bool, Instrumentation] = False
     ) -> ValidationResult:
         """Validate multiple records.
         
+        Args:
+            records: Records to validate
+            profile: Also compute per-field data-quality metrics in the
+                same pass (available as ``result.profile``)
+            instrument: Record time and memory for the validate and result
+                stages in ``result.metrics``; pass an Instrumentation to add
+                to one already in use. The measured code is the normal
+                single pass, so conversion and checks, which run
+                interleaved per field, are both part of ``validate``
+        
         Returns:
             ValidationResult with all errors and converted records
         """
+        if isinstance(instrument, Instrumentation):
+            instrumentation: Optional[Instrumentation] = instrument
+        else:
+            instrumentation = Instrumentation() if instrument else None
+        
+        try:
+            with measure(instrumentation, "validate"):
+                field_profile = self.new_profile() if profile else None
+                all_errors = self._validate_rows(records, start=1, profile=field_profile)
+            
+            with measure(instrumentation, "result"):
+                result = ValidationResult(
+                    valid=len(all_errors) == 0,
+                    errors=all_errors,
+                    records_validated=len(records),
+                    profile=field_profile
+                )
+        finally:
+            if instrumentation is not None and instrumentation is not instrument:
+                instrumentation.stop()
+        
+        if instrumentation is not None:
+            result.metrics = instrumentation.to_dict()
+        return result
+    
+    def new_profile(self) -> Profile:
+        """Create an empty profile covering this schema's fields."""
+        return Profile([f.name for f in self.fields])
+    
+    async def avalidate_stream(
+        self,
+        records: AsyncIterable[Dict[str, Any]],
+        batch_size: int = 500,
+        max_pending: int = 4,
+        executor=None,
+        profile: bool = False
+    ) -> ValidationResult:
+        """Validate records from an async source in micro-batches.
+        
+        Records are grouped into batches of ``batch_size`` and handed to a
+        bounded queue holding at most ``max_pending`` batches. Each batch is
+        validated in ``executor`` (the loop's default thread pool if None)
+        so the event loop stays responsive. When validation falls behind,
+        the queue fills up and the source is no longer iterated, so a slow
+        validator slows the producer instead of growing memory.
+        
+        Args:
+            records: Async iterable of records
+            batch_size: Number of records per micro-batch
+            max_pending: Maximum number of batches buffered ahead of validation
+            executor: concurrent.futures executor for batch validation
+            profile: Also compute per-field data-quality metrics
+            
+        Returns:
+            ValidationResult with all errors
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        
+        async def produce():
+            try:
+                batch = []
+                async for record in records:
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        await queue.put(batch)
+                        batch = []
+                if batch:
+                    await queue.put(batch)
+            except Exception:
+                # Wake the consumer; the error is re-raised when it awaits us
+                await queue.put(None)
+                raise
+            await queue.put(None)
+        
+        producer = asyncio.ensure_future(produce())
+        field_profile = self.new_profile() if profile else None
         all_errors = []
-        converted_records = []
+        records_validated = 0
         
-        for row_num, record in enumerate(records, start=1):
-            errors, converted = self.validate_record(record, row=row_num)
-            all_errors.extend(errors)
-            converted_records.append(converted)
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                errors = await loop.run_in_executor(
+                    executor, self._validate_rows, batch, records_validated + 1, field_profile
+                )
+                all_errors.extend(errors)
+                records_validated += len(batch)
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
         
         return ValidationResult(
             valid=len(all_errors) == 0,
             errors=all_errors,
-            records_validated=len(records)
+            records_validated=records_validated,
+            profile=field_profile
         )
     
+    def _validate_rows(
+        self,
+        records: List[Dict[str, Any]],
+        start: int,
+        profile: Optional[Profile] = None
+    ) -> List[ValidationError]:
+        """Validate records numbered from ``start`` and return their errors."""
+        all_errors = []
+        for row_num, record in enumerate(records, start=start):
+            errors, converted = self.validate_record(record, row=row_num)
+            all_errors.extend(errors)
+            if profile is not None:
+                self.update_profile(profile, record, errors, converted)
+        return all_errors
+    
+    def update_profile(
+        self,
+        profile: Profile,
+        record: Dict[str, Any],
+        errors: List[ValidationError],
+        converted: Dict[str, Any]
+    ) -> None:
+        """Add one validated record to ``profile``."""
+        failed = {e.field for e in errors}
+        for field in self.fields:
+            field_profile = profile.fields[field.name]
+            if field.name in failed:
+                field_profile.add_invalid()
+                continue
+            if field.name not in converted:
+                # Not checked for this record (another record type's field)
+                continue
+            value = record.get(field.name)
+            if value is None or value == "":
+                field_profile.add_null()
+            else:
+                field_profile.add(converted[field.name])
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export schema definition."""
         return {
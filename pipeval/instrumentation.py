@@ -0,0 +1,119 @@
+"""Opt-in memory and allocation instrumentation for validation runs."""
+
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, if the OS exposes it."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes (high-water mark)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Instrumentation:
+    """Collect time, RSS and tracemalloc figures per named stage.
+
+    Each ``stage()`` block records:
+
+    - ``seconds``: wall time
+    - ``allocated_bytes``: traced memory still held at the end of the stage
+    - ``peak_bytes``: traced memory high-water mark above the stage's start
+    - ``net_blocks``: change in live allocated blocks (with ``count_blocks``,
+      which snapshots every live trace around each stage and is off by
+      default because that is slow and large on big batches)
+    - ``rss_bytes`` / ``peak_rss_bytes``: process RSS after the stage, read
+      before any tracemalloc snapshot so they exclude the profiler's copy
+
+    Extra keyword labels (such as the reader ``format``) are stored with the
+    stage. Repeated stages accumulate. tracemalloc is started on first use
+    and stopped by ``stop()`` if this object started it; tracing slows
+    Python allocations noticeably, so only enable it for measurement runs.
+    On Python 3.8, which lacks ``tracemalloc.reset_peak``, ``peak_bytes``
+    is measured from the start of tracing instead of the stage.
+    """
+
+    def __init__(self, count_blocks: bool = False):
+        self.count_blocks = count_blocks
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, **labels) -> Iterator[None]:
+        """Measure the enclosed block as stage ``name``."""
+        self.start()
+        blocks_before = len(tracemalloc.take_snapshot().traces) if self.count_blocks else 0
+        reset_peak = getattr(tracemalloc, "reset_peak", None)
+        if reset_peak is not None:
+            reset_peak()
+        current_before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            rss, max_rss = current_rss(), peak_rss()
+            # Snapshots copy every live trace, so they come after the RSS reads
+            blocks_after = len(tracemalloc.take_snapshot().traces) if self.count_blocks else 0
+            self._record(name, labels, {
+                "seconds": seconds,
+                "allocated_bytes": current - current_before,
+                "peak_bytes": max(0, peak - current_before),
+                "net_blocks": blocks_after - blocks_before if self.count_blocks else None,
+                "rss_bytes": rss,
+                "peak_rss_bytes": max_rss,
+            })
+
+    def _record(self, name: str, labels: Dict[str, Any], metrics: Dict[str, Any]) -> None:
+        existing = self.stages.get(name)
+        if existing is None:
+            self.stages[name] = dict(labels, **metrics)
+            return
+        for key in ("seconds", "allocated_bytes", "net_blocks"):
+            if existing.get(key) is not None and metrics[key] is not None:
+                existing[key] += metrics[key]
+        for key in ("peak_bytes", "rss_bytes", "peak_rss_bytes"):
+            if metrics[key] is not None:
+                existing[key] = max(existing.get(key) or 0, metrics[key])
+        existing.update(labels)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: dict(metrics) for name, metrics in self.stages.items()}
+
+
+def measure(instrumentation: Optional[Instrumentation], name: str, **labels):
+    """``instrumentation.stage(name)``, or a no-op context when it is None."""
+    if instrumentation is None:
+        return nullcontext()
+    return instrumentation.stage(name, **labels)
@@ -0,0 +1,168 @@
+"""Load test for the validation server.
+
+Measures requests/sec and latency percentiles over keep-alive connections::
+
+    python -m pipeval.loadtest --requests 5000 --concurrency 16 --batch-size 100
+
+Without ``--port`` an in-process server with a sample schema is started.
+It then shares the CPU with the client, so numbers from a separate server
+process are more representative.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+from .core import Schema, Field
+from .types import DataType
+from .validators import Validators
+from .server import ValidationServer
+
+
+SAMPLE_SCHEMA = Schema([
+    Field("id", DataType.INTEGER, required=True),
+    Field("email", DataType.STRING, validators=[Validators.email()]),
+    Field("age", DataType.INTEGER, validators=[Validators.range_check(0, 150)]),
+    Field("status", DataType.STRING, validators=[Validators.one_of(["active", "inactive"])]),
+])
+
+
+def sample_records(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "age": i % 120,
+            "status": "active" if i % 3 else "inactive",
+        }
+        for i in range(count)
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(math.ceil(q * len(sorted_values))) - 1)
+    return sorted_values[index]
+
+
+async def _client(
+    host: str,
+    port: int,
+    request: bytes,
+    count: int,
+    latencies: List[float]
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if b" 200 " not in status_line:
+                raise RuntimeError(f"Unexpected response: {status_line!r}")
+    finally:
+        writer.close()
+
+
+async def run_load_test(
+    host: str = "127.0.0.1",
+    port: Optional[int] = None,
+    schema_name: str = "sample",
+    records: Optional[List[Dict[str, Any]]] = None,
+    requests: int = 1000,
+    concurrency: int = 8,
+    batch_size: int = 100
+) -> Dict[str, float]:
+    """Send ``requests`` batched requests over ``concurrency`` connections.
+
+    Starts an in-process server with SAMPLE_SCHEMA when ``port`` is None.
+
+    Returns:
+        Dict with requests_per_sec, records_per_sec and latency percentiles (ms)
+    """
+    server = None
+    if port is None:
+        server = ValidationServer({schema_name: SAMPLE_SCHEMA}, host=host, port=0)
+        await server.start()
+        port = server.port
+
+    body = json.dumps(records if records is not None else sample_records(batch_size)).encode()
+    request = (
+        f"POST /validate/{schema_name} HTTP/1.1\r\n"
+        f"Host: {host}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+    latencies: List[float] = []
+    per_client = [
+        requests // concurrency + (i < requests % concurrency) for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            _client(host, port, request, count, latencies) for count in per_client if count
+        ))
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    batch = len(records) if records is not None else batch_size
+    return {
+        "requests": len(latencies),
+        "requests_per_sec": len(latencies) / elapsed,
+        "records_per_sec": len(latencies) * batch / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Load test a pipeval validation server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="Server port (default: start one in-process)")
+    parser.add_argument("--schema", default="sample", help="Schema name to validate against")
+    parser.add_argument("--records", help="JSON file with the batch of records to send")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    records = None
+    if args.records:
+        with open(args.records, "r", encoding="utf-8") as f:
+            records = json.load(f)
+
+    stats = asyncio.run(run_load_test(
+        host=args.host,
+        port=args.port,
+        schema_name=args.schema,
+        records=records,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size
+    ))
+    for key, value in stats.items():
+        print(f"{key:>18}: {value:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
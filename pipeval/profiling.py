@@ -0,0 +1,364 @@
+"""Single-pass column profiling with constant-memory sketches."""
+
+import base64
+import hashlib
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class HyperLogLog:
+    """Approximate distinct counter.
+
+    Uses ``2 ** precision`` one-byte registers; the standard error is about
+    ``1.04 / sqrt(2 ** precision)`` (1.6% at the default precision of 12).
+    Values are hashed with BLAKE2b rather than ``hash()`` so sketches built
+    in different processes can be merged.
+    """
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, value: Any) -> None:
+        digest = hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+        x = int.from_bytes(digest, "big")
+        index = x >> (64 - self.precision)
+        rest = x & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(bytes(self.registers)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(state["precision"])
+        registers = base64.b64decode(state["registers"])
+        if len(registers) != sketch.m:
+            raise ValueError("HyperLogLog state has the wrong number of registers")
+        sketch.registers = bytearray(registers)
+        return sketch
+
+    def count(self) -> int:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class KLLSketch:
+    """Approximate quantile sketch (KLL).
+
+    Keeps a stack of compactors whose capacities shrink geometrically with
+    depth; a full compactor sorts its items and promotes every other one
+    to the next level with doubled weight. Memory is O(k) and rank error
+    is roughly ``1.7 / k``.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.count = 0
+        self.compactors: List[List[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    def add(self, value: float) -> None:
+        self.compactors[0].append(value)
+        self.count += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def to_state(self) -> Dict[str, Any]:
+        version, internal, gauss_next = self._rng.getstate()
+        return {
+            "k": self.k,
+            "count": self.count,
+            "compactors": [list(items) for items in self.compactors],
+            "rng": [version, list(internal), gauss_next],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(state["k"])
+        sketch.count = state["count"]
+        sketch.compactors = [list(items) for items in state["compactors"]]
+        version, internal, gauss_next = state["rng"]
+        sketch._rng.setstate((version, tuple(internal), gauss_next))
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the approximate ``q``-quantile (0 <= q <= 1)."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        weighted = sorted(
+            (item, 1 << level)
+            for level, items in enumerate(self.compactors)
+            for item in items
+        )
+        if not weighted:
+            return [None] * len(qs)
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for q in qs:
+            target = q * total
+            cumulative = 0
+            value = weighted[-1][0]
+            for item, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                items.sort()
+                # An odd leftover stays behind so total weight is preserved
+                keep = items.pop() if len(items) % 2 else None
+                offset = self._rng.getrandbits(1)
+                self.compactors[level + 1].extend(items[offset::2])
+                self.compactors[level] = [keep] if keep is not None else []
+            level += 1
+
+
+class RunningStats:
+    """Mean and variance via Welford's algorithm, mergeable with Chan's formula."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RunningStats":
+        stats = cls()
+        stats.count = state["count"]
+        stats.mean = state["mean"]
+        stats.m2 = state["m2"]
+        return stats
+
+    @property
+    def variance(self) -> Optional[float]:
+        if self.count < 2:
+            return None
+        return self.m2 / (self.count - 1)
+
+
+class FieldProfile:
+    """Data-quality metrics for one field.
+
+    ``min`` and ``max`` are only reported while the field's values can be
+    compared with each other; a dict value, or a mix such as a string and
+    an int, leaves them as None.
+    """
+
+    QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.null_count = 0
+        self.invalid_count = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.orderable = True
+        self.distinct = HyperLogLog()
+        self.quantiles = KLLSketch()
+        self.stats = RunningStats()
+
+    def add(self, value: Any) -> None:
+        """Record a converted, valid value."""
+        self.count += 1
+        if value is None:
+            self.null_count += 1
+            return
+        self._update_range(value, value)
+        self.distinct.add(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            self.quantiles.add(value)
+            self.stats.add(value)
+
+    def add_null(self) -> None:
+        self.count += 1
+        self.null_count += 1
+
+    def add_invalid(self) -> None:
+        self.count += 1
+        self.invalid_count += 1
+
+    def merge(self, other: "FieldProfile") -> None:
+        self.count += other.count
+        self.null_count += other.null_count
+        self.invalid_count += other.invalid_count
+        if not other.orderable:
+            self._unorderable()
+        elif other.min is not None:
+            self._update_range(other.min, other.max)
+        self.distinct.merge(other.distinct)
+        self.quantiles.merge(other.quantiles)
+        self.stats.merge(other.stats)
+
+    def _update_range(self, low: Any, high: Any) -> None:
+        if not self.orderable:
+            return
+        if isinstance(low, dict):
+            self._unorderable()
+            return
+        try:
+            if self.min is None or low < self.min:
+                self.min = low
+            if self.max is None or high > self.max:
+                self.max = high
+        except TypeError:
+            self._unorderable()
+
+    def _unorderable(self) -> None:
+        self.orderable = False
+        self.min = None
+        self.max = None
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "null_count": self.null_count,
+            "invalid_count": self.invalid_count,
+            "min": self.min,
+            "max": self.max,
+            "orderable": self.orderable,
+            "distinct": self.distinct.to_state(),
+            "quantiles": self.quantiles.to_state(),
+            "stats": self.stats.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, name: str, state: Dict[str, Any]) -> "FieldProfile":
+        profile = cls(name)
+        profile.count = state["count"]
+        profile.null_count = state["null_count"]
+        profile.invalid_count = state["invalid_count"]
+        profile.min = state["min"]
+        profile.max = state["max"]
+        profile.orderable = state["orderable"]
+        profile.distinct = HyperLogLog.from_state(state["distinct"])
+        profile.quantiles = KLLSketch.from_state(state["quantiles"])
+        profile.stats = RunningStats.from_state(state["stats"])
+        return profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        numeric = self.stats.count > 0
+        variance = self.stats.variance
+        return {
+            "count": self.count,
+            "null_count": self.null_count,
+            "null_rate": self.null_count / self.count if self.count else 0.0,
+            "invalid_count": self.invalid_count,
+            "min": self.min,
+            "max": self.max,
+            "distinct_count": self.distinct.count(),
+            "mean": self.stats.mean if numeric else None,
+            "variance": variance,
+            "stddev": math.sqrt(variance) if variance is not None else None,
+            "quantiles": (
+                dict(zip(self.QUANTILES, self.quantiles.quantiles(self.QUANTILES)))
+                if numeric else {}
+            ),
+        }
+
+
+class Profile:
+    """Per-field profiles for a dataset; partial profiles can be merged.
+
+    ``to_state()`` gives a JSON-compatible snapshot of every sketch, tagged
+    with ``STATE_VERSION``, that ``from_state()`` restores exactly.
+    """
+
+    STATE_VERSION = 1
+
+    def __init__(self, field_names: Sequence[str]):
+        self.fields: Dict[str, FieldProfile] = {
+            name: FieldProfile(name) for name in field_names
+        }
+
+    def __getitem__(self, name: str) -> FieldProfile:
+        return self.fields[name]
+
+    def merge(self, other: "Profile") -> "Profile":
+        """Merge another profile (e.g. from a parallel shard) into this one."""
+        for name, field_profile in other.fields.items():
+            if name not in self.fields:
+                self.fields[name] = FieldProfile(name)
+            self.fields[name].merge(field_profile)
+        return self
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "version": self.STATE_VERSION,
+            "fields": {name: fp.to_state() for name, fp in self.fields.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "Profile":
+        if state.get("version") != cls.STATE_VERSION:
+            raise ValueError(f"Unsupported profile state version: {state.get('version')}")
+        profile = cls([])
+        profile.fields = {
+            name: FieldProfile.from_state(name, field_state)
+            for name, field_state in state["fields"].items()
+        }
+        return profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: fp.to_dict() for name, fp in self.fields.items()}
@@ -0,0 +1,120 @@
+"""Helpers for checking schema rules against storage-level metadata."""
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+from .types import DataType
+
+
+NUMERIC_TYPES = (DataType.INTEGER, DataType.FLOAT)
+
+# Integers beyond 2**53 change value in float(), which conversion and the
+# numeric validators go through, so exact statistics cannot decide them
+EXACT_FLOAT_LIMIT = 2 ** 53
+
+# Parquet physical types whose values convert losslessly for each field type
+_EXACT_PHYSICAL_TYPES = {
+    DataType.INTEGER: ("INT32", "INT64"),
+    DataType.FLOAT: ("INT32", "INT64", "FLOAT", "DOUBLE"),
+}
+
+
+def numeric_bounds(field) -> Optional[Tuple[float, float]]:
+    """Return the (lower, upper) bounds a numeric field enforces.
+
+    Returns None if the field is not numeric or has any validator other
+    than ``required``, ``minimum``, ``maximum`` or ``range_check``, since
+    such fields cannot be decided from min/max statistics alone.
+    """
+    if field.data_type not in NUMERIC_TYPES:
+        return None
+
+    lower, upper = -math.inf, math.inf
+    for validator in field.validators:
+        rule = getattr(validator, "rule", None)
+        params = getattr(validator, "params", ())
+        if rule == "required":
+            continue
+        elif rule == "minimum":
+            lower = max(lower, params[0])
+        elif rule == "maximum":
+            upper = min(upper, params[0])
+        elif rule == "range_check":
+            lower = max(lower, params[0])
+            upper = min(upper, params[1])
+        else:
+            return None
+    return lower, upper
+
+
+def stats_prove_valid(
+    field,
+    bounds: Optional[Tuple[float, float]],
+    physical_type: str,
+    num_values: int,
+    null_count: Optional[int],
+    min_value: Any = None,
+    max_value: Any = None
+) -> bool:
+    """Decide whether column statistics prove every value passes ``field``.
+
+    Args:
+        field: Field being checked
+        bounds: Result of ``numeric_bounds(field)``
+        physical_type: Parquet physical type name (e.g. "INT64")
+        num_values: Number of values in the column chunk, including nulls
+        null_count: Number of nulls, or None if unknown
+        min_value: Minimum non-null value, or None if unknown
+        max_value: Maximum non-null value, or None if unknown
+
+    Returns:
+        True only if no value can fail; False means the data must be scanned
+    """
+    if bounds is None or null_count is None:
+        return False
+    if field.required and null_count > 0:
+        return False
+    if null_count == num_values:
+        return True
+    if physical_type not in _EXACT_PHYSICAL_TYPES[field.data_type]:
+        return False
+
+    lower, upper = bounds
+    if lower == -math.inf and upper == math.inf:
+        return True
+    if min_value is None or max_value is None:
+        return False
+    if max(abs(min_value), abs(max_value)) > EXACT_FLOAT_LIMIT:
+        return False
+    return lower <= min_value and max_value <= upper
+
+
+def row_group_provably_valid(
+    field,
+    bounds: Optional[Tuple[float, float]],
+    row_group,
+    column_index: Dict[str, int]
+) -> bool:
+    """Check a field against a pyarrow RowGroupMetaData's column statistics."""
+    if field.name not in column_index:
+        # Missing columns read as all-null
+        return not field.required
+
+    column = row_group.column(column_index[field.name])
+    stats = column.statistics
+    if stats is None or not stats.has_null_count:
+        return False
+    # Timestamps, decimals etc. decode to non-numeric Python objects
+    logical_type = getattr(stats.logical_type, "type", "NONE")
+    if logical_type not in ("NONE", "INT"):
+        return False
+    has_min_max = stats.has_min_max
+    return stats_prove_valid(
+        field,
+        bounds,
+        column.physical_type,
+        row_group.num_rows,
+        stats.null_count,
+        stats.min if has_min_max else None,
+        stats.max if has_min_max else None
+    )
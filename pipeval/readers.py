@@ -1,20 +1,48 @@
 """File readers for multiple formats."""
 
+import io
+import os
 import json
 import csv
-from typing import List, Dict, Any, Optional
+import random
+import time
+from collections import Counter
+from typing import List, Dict, Any, Optional, Iterator, BinaryIO, Sequence, Union
 from pathlib import Path
 
+from .types import ValidationError, ValidationResult
+from .writers import FileWriter
+from .profiling import Profile
+from .routing import RoutedResult, SchemaRouter
+from .pushdown import numeric_bounds, row_group_provably_valid
+from .sampling import SampleResult, cluster_failures, sample_size, weighted_failures
+from .instrumentation import Instrumentation
+
+
+Columns = Optional[Union[Sequence[str], Any]]
+
+CHECKPOINT_VERSION = 1
+
+# Field name used for errors about a whole record that could not be parsed
+RECORD_FIELD = "_record"
+
 
 class FileReader:
-    """Handles reading from multiple file formats."""
+    """Handles reading from multiple file formats.
+    
+    Readers accept an optional ``columns`` argument, either a list of
+    column names or a Schema (meaning its field names). Only those columns
+    are extracted, so memory and CPU scale with the checked columns rather
+    than the table width. Columns absent from the file are left out.
+    """
     
     @staticmethod
-    def read_json(file_path: str) -> List[Dict[str, Any]]:
+    def read_json(file_path: str, columns: Columns = None) -> List[Dict[str, Any]]:
         """Read JSON file and return list of records.
         
         Args:
             file_path: Path to JSON file
+            columns: Column names or Schema to keep (default: all)
             
         Returns:
             List of dictionaries
@@ -31,16 +59,44 @@ class FileReader:
             data = json.load(f)
         
         # Ensure we return a list
-        if isinstance(data, list):
-            return data
-        else:
-            return [data]
+        if not isinstance(data, list):
+            data = [data]
+        
+        names = _column_names(columns)
+        if names is not None:
+            # In place, so each full record is freed as it is projected
+            for i, record in enumerate(data):
+                data[i] = _project(record, names)
+        return data
+    
+    @staticmethod
+    def read_jsonl(
+        file_path: str,
+        encoding: str = 'utf-8',
+        columns: Columns = None
+    ) -> List[Dict[str, Any]]:
+        """Read JSON Lines file and return list of records.
+        
+        Args:
+            file_path: Path to JSONL file
+            encoding: File encoding (default: utf-8)
+            columns: Column names or Schema to keep (default: all)
+            
+        Returns:
+            List of dictionaries
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            json.JSONDecodeError: If a line is not valid JSON
+        """
+        return list(FileReader.iter_jsonl(file_path, encoding, columns))
     
     @staticmethod
     def read_csv(
         file_path: str, 
         delimiter: str = ',',
-        encoding: str = 'utf-8'
+        encoding: str = 'utf-8',
+        columns: Columns = None
     ) -> List[Dict[str, Any]]:
         """Read CSV file and return list of records.
         
@@ -48,6 +104,7 @@ class FileReader:
             file_path: Path to CSV file
             delimiter: CSV delimiter (default: comma)
             encoding: File encoding (default: utf-8)
+            columns: Column names or Schema to keep (default: all)
             
         Returns:
             List of dictionaries
@@ -55,24 +112,15 @@ class FileReader:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        records = []
-        with open(path, 'r', encoding=encoding) as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            for row in reader:
-                records.append(row)
-        
-        return records
+        return list(FileReader.iter_csv(file_path, delimiter, encoding, columns))
     
     @staticmethod
-    def read_parquet(file_path: str) -> List[Dict[str, Any]]:
+    def read_parquet(file_path: str, columns: Columns = None) -> List[Dict[str, Any]]:
         """Read Parquet file and return list of records.
         
         Args:
             file_path: Path to Parquet file
+            columns: Column names or Schema to decode (default: all)
             
         Returns:
             List of dictionaries
@@ -93,17 +141,132 @@ class FileReader:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        table = pq.read_table(path)
+        names = _parquet_columns(pq, path, columns)
+        table = pq.read_table(path, columns=names)
+        if names == []:
+            # None of the columns are in the file; pandas would drop the
+            # rows, but each one still needs validating
+            return [{} for _ in range(table.num_rows)]
         data = table.to_pandas().to_dict('records')
         
         return data
     
     @staticmethod
-    def auto_read(file_path: str, **kwargs) -> List[Dict[str, Any]]:
+    def iter_jsonl(
+        file_path: str,
+        encoding: str = 'utf-8',
+        columns: Columns = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records from a JSON Lines file, skipping blank lines."""
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        names = _column_names(columns)
+        with open(path, 'r', encoding=encoding) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record if names is None else _project(record, names)
+    
+    @staticmethod
+    def iter_csv(
+        file_path: str,
+        delimiter: str = ',',
+        encoding: str = 'utf-8',
+        columns: Columns = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records from a CSV file.
+        
+        With ``columns``, values are extracted by header index and the
+        remaining fields of each row are never turned into dict entries.
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        names = _column_names(columns)
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            if names is None:
+                yield from csv.DictReader(f, delimiter=delimiter)
+                return
+            
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Later duplicates win, as with csv.DictReader
+            positions = {name: i for i, name in enumerate(header)}
+            index = [(name, positions[name]) for name in names if name in positions]
+            for row in reader:
+                if not row:
+                    continue
+                width = len(row)
+                yield {name: row[i] if i < width else None for name, i in index}
+    
+    @staticmethod
+    def iter_parquet(
+        file_path: str,
+        batch_size: int = 1000,
+        columns: Columns = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records from a Parquet file one record batch at a time."""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for Parquet support. "
+                "Install with: pip install data-validator[parquet]"
+            )
+        
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        parquet_file = pq.ParquetFile(path)
+        names = _column_names(columns)
+        if names is not None:
+            available = set(parquet_file.schema_arrow.names)
+            names = [name for name in names if name in available]
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=names):
+            yield from batch.to_pylist()
+    
+    @staticmethod
+    def iter_records(
+        file_path: str,
+        columns: Columns = None,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records, detecting the format from the file extension.
+        
+        JSON arrays are loaded whole; JSONL, CSV and Parquet are streamed.
+        
+        Raises:
+            ValueError: If file format is not supported
+        """
+        suffix = Path(file_path).suffix.lower()
+        
+        if suffix == '.json':
+            return iter(FileReader.read_json(file_path, columns))
+        elif suffix in ('.jsonl', '.ndjson'):
+            return FileReader.iter_jsonl(file_path, columns=columns, **kwargs)
+        elif suffix == '.csv':
+            return FileReader.iter_csv(file_path, columns=columns, **kwargs)
+        elif suffix == '.parquet' or suffix == '.pq':
+            return FileReader.iter_parquet(file_path, columns=columns, **kwargs)
+        else:
+            raise ValueError(
+                f"Unsupported file format: {suffix}. "
+                "Supported: .json, .jsonl, .csv, .parquet"
+            )
+    
+    @staticmethod
+    def auto_read(file_path: str, columns: Columns = None, **kwargs) -> List[Dict[str, Any]]:
         """Automatically detect format and read file.
         
         Args:
             file_path: Path to file
+            columns: Column names or Schema to keep (default: all)
             **kwargs: Additional arguments for specific readers
             
         Returns:
@@ -116,15 +279,17 @@ class FileReader:
         suffix = path.suffix.lower()
         
         if suffix == '.json':
-            return FileReader.read_json(file_path)
+            return FileReader.read_json(file_path, columns)
+        elif suffix in ('.jsonl', '.ndjson'):
+            return FileReader.read_jsonl(file_path, columns=columns, **kwargs)
         elif suffix == '.csv':
-            return FileReader.read_csv(file_path, **kwargs)
+            return FileReader.read_csv(file_path, columns=columns, **kwargs)
         elif suffix == '.parquet' or suffix == '.pq':
-            return FileReader.read_parquet(file_path)
+            return FileReader.read_parquet(file_path, columns)
         else:
             raise ValueError(
                 f"Unsupported file format: {suffix}. "
-                "Supported: .json, .csv, .parquet"
+                "Supported: .json, .jsonl, .csv, .parquet"
             )
 
 
@@ -132,65 +297,1040 @@ class FileValidator:
     """Validate files directly without manual reading."""
     
     @staticmethod
-    def validate_json_file(schema, file_path: str):
+    def validate_json_file(schema, file_path: str, instrument: bool = False):
         """Validate JSON file against schema.
         
         Args:
             schema: Schema object
             file_path: Path to JSON file
+            instrument: Record per-stage time and memory in ``result.metrics``
             
         Returns:
             ValidationResult
         """
-        records = FileReader.read_json(file_path)
-        return schema.validate_batch(records)
+        return _validate_read(
+            schema, "json", lambda: FileReader.read_json(file_path, columns=schema), instrument
+        )
     
     @staticmethod
     def validate_csv_file(
         schema, 
         file_path: str,
         delimiter: str = ',',
-        encoding: str = 'utf-8'
+        encoding: str = 'utf-8',
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 100000,
+        resume: bool = False,
+        profile: bool = False,
+        instrument: bool = False
     ):
         """Validate CSV file against schema.
         
+        With ``checkpoint_path`` the file is streamed and errors are
+        appended to ``<checkpoint_path>.errors`` as they are found. Every
+        ``checkpoint_every`` rows a small JSON checkpoint is saved with the
+        byte offset, row number, error count, length of the error log and
+        the profile's sketch state, along with the schema's fields and
+        rules and the file's size, modification time and inode. With
+        ``resume=True`` validation continues from the last checkpoint,
+        giving the same result as an uninterrupted run. Both files are
+        removed once the file has been fully validated.
+        
         Args:
             schema: Schema object
             file_path: Path to CSV file
             delimiter: CSV delimiter
             encoding: File encoding
+            checkpoint_path: File to store progress in
+            checkpoint_every: Rows between checkpoints
+            resume: Continue from an existing checkpoint
+            profile: Also compute per-field data-quality metrics
+            instrument: Record per-stage time and memory in ``result.metrics``
+                (not available with checkpointing)
             
         Returns:
-            ValidationResult
+            ValidationResult, or a RoutedResult for a SchemaRouter
+            
+        Raises:
+            ValueError: If the checkpoint does not match the schema or file
         """
-        records = FileReader.read_csv(file_path, delimiter, encoding)
-        return schema.validate_batch(records)
+        if checkpoint_path is None:
+            return _validate_read(
+                schema,
+                "csv",
+                lambda: FileReader.read_csv(file_path, delimiter, encoding, columns=schema),
+                instrument,
+                profile=profile
+            )
+        
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        errors_path = f"{checkpoint_path}.errors"
+        with open(path, 'rb') as f:
+            header = _parse_csv_row(_read_raw_record(f, delimiter), delimiter, encoding)
+            stat = os.fstat(f.fileno())
+            state = {
+                "offset": f.tell(),
+                "row": 0,
+                "header": header,
+                "schema": _schema_fingerprint(schema),
+                "file": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino},
+                "error_count": 0,
+                "errors_offset": 0,
+                "profile": None,
+                "type_counts": [],
+            }
+            field_profile = schema.new_profile() if profile else None
+            all_errors: List[ValidationError] = []
+            
+            checkpoint = _load_checkpoint(checkpoint_path) if resume else None
+            if checkpoint is not None:
+                # Resuming anything else would mix old errors with new ones
+                if checkpoint["header"] != header:
+                    raise ValueError("Checkpoint header does not match file")
+                if checkpoint["schema"] != state["schema"]:
+                    raise ValueError("Checkpoint was saved for a different schema")
+                if checkpoint["file"] != state["file"]:
+                    raise ValueError("File has changed since the checkpoint was saved")
+                if profile and checkpoint["profile"] is None:
+                    raise ValueError("Checkpoint was saved without profiling")
+                all_errors = _read_error_log(errors_path, checkpoint["errors_offset"])
+                if len(all_errors) != checkpoint["error_count"]:
+                    raise ValueError("Error log does not match the checkpoint")
+                if profile:
+                    field_profile = Profile.from_state(checkpoint["profile"])
+                state = checkpoint
+                f.seek(state["offset"])
+            type_counts = _type_counter(schema)
+            if type_counts is not None:
+                # Stored as pairs, since JSON object keys can only be strings
+                type_counts.update(dict(state["type_counts"]))
+            
+            # Errors found after the last checkpoint are found again on resume
+            with open(errors_path, 'r+b' if checkpoint is not None else 'wb') as errors_log:
+                errors_log.truncate(state["errors_offset"])
+                errors_log.seek(state["errors_offset"])
+                row = state["row"]
+                while True:
+                    raw = _read_raw_record(f, delimiter)
+                    if not raw:
+                        break
+                    record = _parse_raw_record(raw, header, delimiter, encoding)
+                    if record is None:
+                        continue
+                    row += 1
+                    if type_counts is not None:
+                        type_counts[schema.record_type(record)] += 1
+                    errors, converted = schema.validate_record(record, row=row)
+                    if errors:
+                        all_errors.extend(errors)
+                        errors_log.write(b"".join(_error_line(e) for e in errors))
+                    if field_profile is not None:
+                        schema.update_profile(field_profile, record, errors, converted)
+                    if row % checkpoint_every == 0:
+                        errors_log.flush()
+                        state["offset"] = f.tell()
+                        state["row"] = row
+                        state["error_count"] = len(all_errors)
+                        state["errors_offset"] = errors_log.tell()
+                        state["profile"] = (
+                            field_profile.to_state() if field_profile is not None else None
+                        )
+                        state["type_counts"] = (
+                            list(type_counts.items()) if type_counts is not None else []
+                        )
+                        _save_checkpoint(checkpoint_path, state)
+        
+        for leftover in (checkpoint_path, errors_path):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        
+        return _routed(ValidationResult(
+            valid=len(all_errors) == 0,
+            errors=all_errors,
+            records_validated=row,
+            profile=field_profile
+        ), type_counts)
     
     @staticmethod
-    def validate_parquet_file(schema, file_path: str):
+    def validate_parquet_file(
+        schema,
+        file_path: str,
+        use_statistics: bool = False,
+        instrument: bool = False
+    ):
         """Validate Parquet file against schema.
         
+        With ``use_statistics``, each row group's footer statistics are
+        checked first. Numeric fields whose only checks are ``required``,
+        ``minimum``, ``maximum`` or ``range_check`` are not decoded in row
+        groups where the min/max/null-count statistics prove every value
+        passes; row groups where all fields pass are skipped entirely.
+        Values are read as Python objects, so nulls are treated as missing
+        rather than NaN. Statistics are not split by record type, so a
+        SchemaRouter cannot be used with ``use_statistics``.
+        
         Args:
             schema: Schema object
             file_path: Path to Parquet file
+            use_statistics: Skip data that row-group statistics prove valid
+            instrument: Record per-stage time and memory in ``result.metrics``
+                (not available with ``use_statistics``)
             
         Returns:
             ValidationResult
+            
+        Raises:
+            ValueError: If ``use_statistics`` is set for a SchemaRouter
         """
-        records = FileReader.read_parquet(file_path)
-        return schema.validate_batch(records)
+        if not use_statistics:
+            return _validate_read(
+                schema,
+                "parquet",
+                lambda: FileReader.read_parquet(file_path, columns=schema),
+                instrument
+            )
+        if isinstance(schema, SchemaRouter):
+            raise ValueError(
+                "use_statistics cannot check a SchemaRouter: each record's fields "
+                "depend on its type"
+            )
+        
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for Parquet support. "
+                "Install with: pip install data-validator[parquet]"
+            )
+        
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.metadata
+        column_index = {
+            metadata.schema.column(j).name: j for j in range(metadata.num_columns)
+        }
+        bounds = {f.name: numeric_bounds(f) for f in schema.fields}
+        all_errors = []
+        row_offset = 0
+        
+        for group in range(metadata.num_row_groups):
+            row_group = metadata.row_group(group)
+            scan = [
+                f for f in schema.fields
+                if not row_group_provably_valid(f, bounds[f.name], row_group, column_index)
+            ]
+            if scan:
+                columns = [f.name for f in scan if f.name in column_index]
+                if columns:
+                    table = parquet_file.read_row_group(group, columns=columns)
+                    rows = table.to_pylist()
+                else:
+                    rows = [{}] * row_group.num_rows
+                for row_num, record in enumerate(rows, start=row_offset + 1):
+                    for field in scan:
+                        value = record.get(field.name)
+                        is_valid, error_msg, _ = field.validate(value, row_num)
+                        if not is_valid:
+                            all_errors.append(ValidationError(
+                                field=field.name,
+                                value=value,
+                                message=error_msg,
+                                row=row_num
+                            ))
+            row_offset += row_group.num_rows
+        
+        return ValidationResult(
+            valid=len(all_errors) == 0,
+            errors=all_errors,
+            records_validated=row_offset
+        )
     
     @staticmethod
-    def validate_file(schema, file_path: str, **kwargs):
+    def validate_file(schema, file_path: str, instrument: bool = False, **kwargs):
         """Validate file (auto-detect format).
         
         Args:
             schema: Schema object
             file_path: Path to file
+            instrument: Record per-stage time and memory in ``result.metrics``
             **kwargs: Additional arguments for specific readers
             
         Returns:
             ValidationResult
         """
-        records = FileReader.auto_read(file_path, **kwargs)
-        return schema.validate_batch(records)
+        return _validate_read(
+            schema,
+            Path(file_path).suffix.lower().lstrip('.'),
+            lambda: FileReader.auto_read(file_path, columns=schema, **kwargs),
+            instrument
+        )
+    
+    @staticmethod
+    def route_file(
+        schema,
+        file_path: str,
+        valid_path: str,
+        invalid_path: str,
+        batch_size: int = 1000,
+        error_field: str = "_errors",
+        **kwargs
+    ):
+        """Validate a file and split its rows into valid and quarantine outputs.
+        
+        The input is read once. Converted valid records go to ``valid_path``;
+        invalid rows are written unchanged to ``invalid_path`` with their
+        error messages added under ``error_field``. Output formats are
+        detected from the file extensions (.csv, .jsonl, .parquet) and
+        writes are buffered in batches of ``batch_size``. A Parquet
+        quarantine file stores every value as text, since invalid rows are
+        the ones whose types are wrong. CSV and Parquet quarantine files
+        take their columns from the first invalid rows and raise ValueError
+        if a later row has other fields; use .jsonl when the input's fields
+        vary from row to row.
+        
+        Args:
+            schema: Schema object
+            file_path: Path to input file
+            valid_path: Path for converted valid records
+            invalid_path: Path for quarantined invalid rows
+            batch_size: Number of records buffered per write
+            error_field: Name of the column holding error messages
+            **kwargs: Additional arguments for specific readers
+            
+        Returns:
+            ValidationResult, or a RoutedResult for a SchemaRouter
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        records = FileReader.iter_records(file_path, **kwargs)
+        all_errors = []
+        records_validated = 0
+        type_counts = _type_counter(schema)
+        valid_out = FileWriter.open(valid_path, batch_size, **_writer_kwargs(valid_path, schema))
+        try:
+            invalid_out = FileWriter.open(
+                invalid_path, batch_size, **_writer_kwargs(invalid_path, schema, quarantine=True)
+            )
+        except BaseException:
+            valid_out.close()
+            raise
+        
+        with valid_out, invalid_out:
+            for row_num, record in enumerate(records, start=1):
+                if type_counts is not None:
+                    type_counts[schema.record_type(record)] += 1
+                errors, converted = schema.validate_record(record, row=row_num)
+                records_validated += 1
+                if errors:
+                    all_errors.extend(errors)
+                    quarantined = dict(record)
+                    quarantined[error_field] = [str(e) for e in errors]
+                    invalid_out.write(quarantined)
+                else:
+                    valid_out.write(converted)
+        
+        return _routed(ValidationResult(
+            valid=len(all_errors) == 0,
+            errors=all_errors,
+            records_validated=records_validated
+        ), type_counts)
+    
+    @staticmethod
+    def sample_file(
+        schema,
+        file_path: str,
+        confidence: float = 0.95,
+        margin: float = 0.01,
+        seed: Optional[int] = None,
+        max_errors: int = 100,
+        delimiter: str = ',',
+        encoding: str = 'utf-8'
+    ) -> SampleResult:
+        """Estimate a file's error rates from a random sample of records.
+        
+        The sample is sized so the estimated error rates fall within
+        ``margin`` of the true rates at the given ``confidence``. CSV and
+        JSONL files are sampled by seeking to random byte offsets and
+        re-synchronizing on the next record boundary; Parquet files are
+        sampled by whole random row groups. Files too small to benefit are
+        validated in full and reported as exact.
+        
+        A seek picks the record after the line it lands in, with probability
+        proportional to that line's length, so each sampled record is
+        weighted by the inverse of that length, and the bounds use the
+        weighted sample's effective size. Short and long CSV rows are kept
+        like in a full read, and records that cannot be parsed count as
+        failed rows with an error on the ``_record`` field. Only rows of the
+        wrong width holding an unbalanced quote are dropped, since they are
+        almost always the tail of a multi-line quoted field the seek landed
+        in.
+        
+        Rows of one Parquet row group are not independent draws, so the
+        Parquet bounds come from the variation between the sampled row
+        groups (see ``cluster_failures``) and are wide when few groups are
+        read; ``bytes_read`` counts the compressed column chunks read.
+        
+        Args:
+            schema: Schema object
+            file_path: Path to CSV, JSONL or Parquet file
+            confidence: Confidence level of the reported bounds
+            margin: Target half-width of the confidence interval
+            seed: Random seed for reproducible samples
+            max_errors: Maximum number of sample errors kept for inspection
+            delimiter: CSV delimiter
+            encoding: File encoding
+            
+        Returns:
+            SampleResult
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is not supported
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        suffix = path.suffix.lower()
+        target = sample_size(confidence, margin)
+        rng = random.Random(seed)
+        
+        if suffix == '.parquet' or suffix == '.pq':
+            return _sample_parquet(schema, path, target, rng, confidence, max_errors)
+        if suffix == '.csv':
+            records, weights, bytes_read, exact = _sample_text_records(
+                path, target, rng, encoding, csv_delimiter=delimiter
+            )
+        elif suffix in ('.jsonl', '.ndjson'):
+            records, weights, bytes_read, exact = _sample_text_records(
+                path, target, rng, encoding
+            )
+        else:
+            raise ValueError(
+                f"Unsupported format for sampling: {suffix}. "
+                "Supported: .csv, .jsonl, .parquet"
+            )
+        
+        row_failed, field_failed, kept_errors = _sample_failures(schema, records, max_errors)
+        
+        effective_size = None
+        field_effective_sizes = None
+        if weights:
+            row_failures, effective_size = weighted_failures(weights, row_failed)
+            field_failures = {}
+            field_effective_sizes = {}
+            for name, failed in field_failed.items():
+                field_failures[name], field_effective_sizes[name] = (
+                    weighted_failures(weights, failed)
+                )
+        else:
+            row_failures = sum(row_failed)
+            field_failures = {name: sum(failed) for name, failed in field_failed.items()}
+        
+        return SampleResult(
+            sample_size=len(records),
+            confidence=confidence,
+            row_failures=row_failures,
+            field_failures=field_failures,
+            errors=kept_errors,
+            bytes_read=bytes_read,
+            bytes_total=path.stat().st_size,
+            exact=exact,
+            effective_size=effective_size,
+            field_effective_sizes=field_effective_sizes
+        )
+    
+    @staticmethod
+    def follow_file(
+        schema,
+        file_path: str,
+        interval: float = 5.0,
+        max_polls: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[ValidationResult]:
+        """Continuously validate records appended to a CSV or JSONL file.
+        
+        Yields one incremental ValidationResult per poll, covering only the
+        records appended since the previous poll. See FileFollower.
+        
+        Args:
+            schema: Schema object
+            file_path: Path to CSV or JSONL file
+            interval: Seconds to wait between polls
+            max_polls: Stop after this many polls (None to follow forever)
+            **kwargs: Additional arguments for FileFollower
+        """
+        with FileFollower(schema, file_path, **kwargs) as follower:
+            polls = 0
+            while max_polls is None or polls < max_polls:
+                if polls:
+                    time.sleep(interval)
+                yield follower.poll()
+                polls += 1
+
+
+class FileFollower:
+    """Incrementally validate an append-only CSV or JSONL file.
+    
+    Each ``poll()`` seeks to the last validated byte offset and validates
+    only the complete records appended since, so its cost is proportional
+    to the new data. A trailing record without its newline (or a CSV
+    record with an open quoted field) is left for the next poll. A record
+    that cannot be parsed is reported as an error on the ``_record`` field
+    and following continues.
+    
+    The file is kept open between polls, so when it is renamed or replaced
+    (rotation), the next poll first validates the complete records
+    appended to the old file, then follows the new file from its start
+    with row numbers starting again at 1. A file truncated in place is
+    followed from its start too; records written before the truncation
+    that were not yet polled are lost. Call ``close()`` (or use the
+    follower as a context manager) when done.
+    """
+    
+    def __init__(
+        self,
+        schema,
+        file_path: str,
+        delimiter: str = ',',
+        encoding: str = 'utf-8'
+    ):
+        suffix = Path(file_path).suffix.lower()
+        if suffix not in ('.csv', '.jsonl', '.ndjson'):
+            raise ValueError(
+                f"Unsupported format for following: {suffix}. "
+                "Supported: .csv, .jsonl"
+            )
+        self.schema = schema
+        self.file_path = file_path
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.quoted = suffix == '.csv'
+        self.offset = 0
+        self.row = 0
+        self.rotations = 0
+        self.records_validated = 0
+        self.error_count = 0
+        self._header: Optional[List[str]] = None
+        self._file: Optional[BinaryIO] = None
+        self._file_id: Optional[tuple] = None
+        self._type_counts: Optional[Counter] = None
+    
+    def poll(self) -> ValidationResult:
+        """Validate the complete records appended since the last poll.
+        
+        Returns:
+            ValidationResult, or a RoutedResult for a SchemaRouter
+        """
+        all_errors: List[ValidationError] = []
+        new_records = 0
+        self._type_counts = _type_counter(self.schema)
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            stat = None
+        
+        if self._file is not None:
+            if stat is None or (stat.st_dev, stat.st_ino) != self._file_id:
+                # Rotated: finish the records appended to the old file
+                # before it was renamed, then move on to the new one
+                new_records += self._validate_new(self._file, all_errors)
+                if stat is None:
+                    # Mid-rotation; the new file will be picked up on a later poll
+                    return self._result(new_records, all_errors)
+                self.close()
+                self._restart()
+            elif stat.st_size < self.offset:
+                # Truncated in place; anything written before is gone
+                self._restart()
+        
+        if self._file is None:
+            try:
+                self._file = open(self.file_path, 'rb')
+            except FileNotFoundError:
+                return self._result(new_records, all_errors)
+            opened = os.fstat(self._file.fileno())
+            self._file_id = (opened.st_dev, opened.st_ino)
+        
+        new_records += self._validate_new(self._file, all_errors)
+        return self._result(new_records, all_errors)
+    
+    def close(self) -> None:
+        """Close the followed file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _restart(self) -> None:
+        self.rotations += 1
+        self.offset = 0
+        self.row = 0
+        self._header = None
+    
+    def _result(self, new_records: int, errors: List[ValidationError]) -> ValidationResult:
+        self.records_validated += new_records
+        self.error_count += len(errors)
+        return _routed(ValidationResult(
+            valid=len(errors) == 0,
+            errors=errors,
+            records_validated=new_records
+        ), self._type_counts)
+    
+    def _validate_new(self, f: BinaryIO, all_errors: List[ValidationError]) -> int:
+        """Validate complete records after ``self.offset``; return how many."""
+        new_records = 0
+        f.seek(self.offset)
+        if self.quoted and self._header is None:
+            raw = self._read_complete(f)
+            if raw is None:
+                return 0
+            self._header = _parse_csv_row(raw, self.delimiter, self.encoding)
+            self.offset = f.tell()
+        
+        while True:
+            raw = self._read_complete(f)
+            if raw is None:
+                break
+            self.offset = f.tell()
+            record = _parse_or_error(
+                raw, self._header, self.delimiter, self.encoding, self.row + 1
+            )
+            if record is None:
+                continue
+            self.row += 1
+            new_records += 1
+            if isinstance(record, ValidationError):
+                # A bad line is reported like any invalid record; it must
+                # not end the poll or lose the errors collected so far
+                all_errors.append(record)
+                if self._type_counts is not None:
+                    self._type_counts[None] += 1
+                continue
+            if self._type_counts is not None:
+                self._type_counts[self.schema.record_type(record)] += 1
+            errors, _ = self.schema.validate_record(record, row=self.row)
+            all_errors.extend(errors)
+        return new_records
+    
+    def _read_complete(self, f: BinaryIO) -> Optional[bytes]:
+        """Read the next record, or None if it is missing or still being written."""
+        delimiter = self.delimiter if self.quoted else None
+        raw = _read_raw_record(f, delimiter)
+        if not raw.endswith(b'\n'):
+            return None
+        if delimiter is not None and _quote_open(raw, delimiter.encode(), False):
+            return None
+        return raw
+
+
+def _validate_read(schema, file_format: str, read, instrument: bool, **kwargs):
+    """Read records with ``read()`` and validate them, optionally instrumented.
+    
+    When instrumented, the read is measured as a ``read`` stage labelled
+    with ``file_format`` alongside the schema's own stages.
+    """
+    if not instrument:
+        return schema.validate_batch(read(), **kwargs)
+    
+    instrumentation = Instrumentation()
+    try:
+        with instrumentation.stage("read", format=file_format):
+            records = read()
+        return schema.validate_batch(records, instrument=instrumentation, **kwargs)
+    finally:
+        instrumentation.stop()
+
+
+def _type_counter(schema) -> Optional[Counter]:
+    """A Counter for records per type when ``schema`` is a SchemaRouter."""
+    return Counter() if isinstance(schema, SchemaRouter) else None
+
+
+def _routed(result: ValidationResult, type_counts: Optional[Counter]) -> ValidationResult:
+    return result if type_counts is None else RoutedResult(result, type_counts)
+
+
+def _column_names(columns: Columns) -> Optional[List[str]]:
+    """Normalize a column list or Schema to a list of names (None for all)."""
+    if columns is None:
+        return None
+    if hasattr(columns, "fields"):
+        return [f.name for f in columns.fields]
+    return list(columns)
+
+
+def _project(record: Any, names: List[str]) -> Any:
+    if not isinstance(record, dict):
+        return record
+    return {name: record[name] for name in names if name in record}
+
+
+def _parquet_columns(pq, path: Path, columns: Columns) -> Optional[List[str]]:
+    names = _column_names(columns)
+    if names is None:
+        return None
+    # Only request columns the file has; pyarrow errors on unknown names
+    available = set(pq.read_schema(path).names)
+    return [name for name in names if name in available]
+
+
+def _read_raw_record(f: BinaryIO, delimiter: Optional[str] = None) -> bytes:
+    """Read one raw record from a binary file at its current position.
+    
+    With a CSV ``delimiter``, physical lines are joined while a quoted
+    field is still open. Returns b'' at end of file; a returned record that
+    does not end with a newline was cut off by the end of the file.
+    """
+    raw = f.readline()
+    if delimiter is not None and b'"' in raw:
+        separator = delimiter.encode()
+        in_quotes = _quote_open(raw, separator, False)
+        while in_quotes and raw.endswith(b'\n'):
+            line = f.readline()
+            if not line:
+                break
+            raw += line
+            in_quotes = _quote_open(line, separator, True)
+    return raw
+
+
+def _quote_open(data: bytes, delimiter: bytes, in_quotes: bool) -> bool:
+    """Whether a quoted field is still open after ``data``.
+    
+    Follows the csv module's default dialect: a quote only opens a field
+    at the start of that field, so ``5" screen`` is a literal, and a
+    doubled quote inside a quoted field is an escaped quote.
+    """
+    i = data.find(b'"')
+    while i != -1:
+        if in_quotes:
+            if data[i + 1:i + 2] == b'"':
+                i = data.find(b'"', i + 2)
+                continue
+            in_quotes = False
+        elif i == 0 or data[i - len(delimiter):i] == delimiter:
+            in_quotes = True
+        i = data.find(b'"', i + 1)
+    return in_quotes
+
+
+def _parse_csv_row(raw: bytes, delimiter: str, encoding: str) -> List[str]:
+    text = io.StringIO(raw.decode(encoding), newline='')
+    rows = list(csv.reader(text, delimiter=delimiter))
+    if len(rows) > 1:
+        raise csv.Error("Raw record spans more than one CSV row")
+    return rows[0] if rows else []
+
+
+def _csv_record(header: List[str], row: List[str]) -> Dict[str, Any]:
+    # Mirrors csv.DictReader's handling of short and long rows
+    record: Dict[Any, Any] = dict(zip(header, row))
+    if len(row) > len(header):
+        record[None] = row[len(header):]
+    elif len(row) < len(header):
+        for key in header[len(row):]:
+            record[key] = None
+    return record
+
+
+def _parse_raw_record(
+    raw: bytes,
+    header: Optional[List[str]],
+    delimiter: str,
+    encoding: str
+) -> Optional[Dict[str, Any]]:
+    """Parse a raw CSV (when ``header`` is given) or JSONL record; None if blank."""
+    if header is None:
+        if not raw.strip():
+            return None
+        return json.loads(raw.decode(encoding))
+    row = _parse_csv_row(raw, delimiter, encoding)
+    if not row:
+        return None
+    return _csv_record(header, row)
+
+
+def _schema_fingerprint(schema) -> Dict[str, Any]:
+    """Describe a schema's fields and rules as stored in a checkpoint."""
+    fingerprint = schema.to_dict()
+    fingerprint["validators"] = [
+        [
+            [getattr(v, "rule", getattr(v, "__name__", type(v).__name__)),
+             getattr(v, "params", None)]
+            for v in f.validators
+        ]
+        for f in schema.fields
+    ]
+    # Round-trip so it compares equal to the copy loaded from the checkpoint
+    return json.loads(json.dumps(fingerprint, default=str))
+
+
+def _save_checkpoint(checkpoint_path: str, state: Dict[str, Any]) -> None:
+    # Write then rename so a crash mid-write never leaves a torn checkpoint
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(state, version=CHECKPOINT_VERSION), f, default=str)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _load_checkpoint(checkpoint_path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        try:
+            state = json.load(f)
+        except ValueError:
+            raise ValueError(f"Not a checkpoint file: {checkpoint_path}")
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {checkpoint_path}")
+    return state
+
+
+def _error_line(error: ValidationError) -> bytes:
+    return json.dumps({
+        "field": error.field,
+        "value": error.value,
+        "message": error.message,
+        "row": error.row,
+        "record_type": error.record_type,
+    }, default=str).encode('utf-8') + b"\n"
+
+
+def _read_error_log(errors_path: str, length: int) -> List[ValidationError]:
+    """Read the first ``length`` bytes of an error log written by ``_error_line``."""
+    try:
+        with open(errors_path, 'rb') as f:
+            data = f.read(length)
+    except FileNotFoundError:
+        data = b""
+    if len(data) != length:
+        raise ValueError("Error log is shorter than the checkpoint records")
+    return [ValidationError(**json.loads(line)) for line in data.splitlines()]
+
+
+def _sample_text_records(
+    path: Path,
+    target: int,
+    rng: random.Random,
+    encoding: str,
+    csv_delimiter: Optional[str] = None
+) -> tuple:
+    """Sample CSV (if ``csv_delimiter`` is set) or JSONL records by random seeks.
+    
+    Records that cannot be parsed are returned as their ValidationError.
+    
+    Returns:
+        (records, weights, bytes_read, exact); weights are None when exact
+    """
+    delimiter = csv_delimiter or ','
+    
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        header = None
+        if csv_delimiter is not None:
+            header = _parse_csv_row(_read_raw_record(f, csv_delimiter), delimiter, encoding)
+        data_start = f.tell()
+        
+        probe = f.read(65536)
+        estimated_rows = (size - data_start) * max(probe.count(b'\n'), 1) / max(len(probe), 1)
+        
+        if target >= estimated_rows:
+            # Small file: a full scan is about as cheap as sampling and exact
+            f.seek(data_start)
+            records = []
+            while True:
+                raw = _read_raw_record(f, csv_delimiter)
+                if not raw:
+                    break
+                record = _parse_or_error(raw, header, delimiter, encoding)
+                if record is not None:
+                    records.append(record)
+            return records, None, size, True
+        
+        records = []
+        weights = []
+        bytes_read = data_start + len(probe)
+        for offset in sorted(rng.randrange(data_start, size) for _ in range(target)):
+            line_start = _line_start(f, offset, data_start)
+            f.seek(offset)
+            # Skip the partial record we landed in
+            skipped = f.readline()
+            bytes_read += offset - line_start
+            if f.tell() >= size:
+                f.seek(data_start)
+            raw = _read_raw_record(f, csv_delimiter)
+            bytes_read += len(skipped) + len(raw)
+            # A record picked twice is kept twice: the weights assume
+            # sampling with replacement
+            if header is not None and raw.count(b'"') % 2:
+                try:
+                    fragment = len(_parse_csv_row(raw, delimiter, encoding)) != len(header)
+                except (ValueError, csv.Error):
+                    fragment = True
+                if fragment:
+                    # An unbalanced quote in a row of the wrong width is almost
+                    # always the tail of a multi-line quoted field
+                    continue
+            record = _parse_or_error(raw, header, delimiter, encoding)
+            if record is not None:
+                records.append(record)
+                # This record was picked with probability proportional to the
+                # length of the line we landed in
+                weights.append(1.0 / (offset - line_start + len(skipped)))
+    
+    return records, weights, bytes_read, False
+
+
+def _line_start(f: BinaryIO, offset: int, floor: int) -> int:
+    """Byte offset where the physical line containing ``offset`` starts."""
+    pos = offset
+    while pos > floor:
+        step = min(4096, pos - floor)
+        f.seek(pos - step)
+        newline = f.read(step).rfind(b'\n')
+        if newline != -1:
+            return pos - step + newline + 1
+        pos -= step
+    return floor
+
+
+def _sample_parquet(
+    schema,
+    path: Path,
+    target: int,
+    rng: random.Random,
+    confidence: float,
+    max_errors: int
+) -> SampleResult:
+    """Sample whole random row groups from a Parquet file until ``target`` rows."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet support. "
+            "Install with: pip install data-validator[parquet]"
+        )
+    
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    column_index = {
+        metadata.schema.column(j).name: j for j in range(metadata.num_columns)
+    }
+    columns = [f.name for f in schema.fields if f.name in column_index]
+    groups = list(range(metadata.num_row_groups))
+    rng.shuffle(groups)
+    
+    sizes: List[int] = []
+    row_failures: List[int] = []
+    field_failures: Dict[str, List[int]] = {f.name: [] for f in schema.fields}
+    kept_errors: List[ValidationError] = []
+    bytes_read = 0
+    for group in groups:
+        row_group = metadata.row_group(group)
+        if columns:
+            records = parquet_file.read_row_group(group, columns=columns).to_pylist()
+        else:
+            records = [{}] * row_group.num_rows
+        bytes_read += sum(
+            row_group.column(column_index[name]).total_compressed_size for name in columns
+        )
+        row_failed, field_failed, errors = _sample_failures(
+            schema, records, max_errors - len(kept_errors)
+        )
+        kept_errors.extend(errors)
+        sizes.append(len(records))
+        row_failures.append(sum(row_failed))
+        for name, counts in field_failures.items():
+            counts.append(sum(field_failed[name]))
+        if sum(sizes) >= target:
+            break
+    
+    result = SampleResult(
+        sample_size=sum(sizes),
+        confidence=confidence,
+        row_failures=sum(row_failures),
+        field_failures={name: sum(counts) for name, counts in field_failures.items()},
+        errors=kept_errors,
+        bytes_read=bytes_read,
+        bytes_total=path.stat().st_size,
+        exact=len(sizes) == len(groups)
+    )
+    if not result.exact:
+        # Rows of a row group are not independent draws; the groups are
+        result.row_failures, result.effective_size = cluster_failures(
+            sizes, row_failures, len(groups)
+        )
+        for name, counts in field_failures.items():
+            result.field_failures[name], result.field_effective_sizes[name] = (
+                cluster_failures(sizes, counts, len(groups))
+            )
+    return result
+
+
+def _sample_failures(schema, records: List[Any], max_errors: int) -> tuple:
+    """Validate sampled records, which may be ValidationErrors for unparseable ones.
+    
+    Returns:
+        (row_failed, field_failed, kept_errors) with per-record failure flags
+    """
+    row_failed = []
+    field_failed = {f.name: [False] * len(records) for f in schema.fields}
+    kept_errors: List[ValidationError] = []
+    for i, record in enumerate(records):
+        if isinstance(record, ValidationError):
+            errors = [record]
+        else:
+            errors, _ = schema.validate_record(record)
+        row_failed.append(bool(errors))
+        for error in errors:
+            field_failed.setdefault(error.field, [False] * len(records))[i] = True
+        kept_errors.extend(errors[:max(max_errors - len(kept_errors), 0)])
+    return row_failed, field_failed, kept_errors
+
+
+def _parse_or_error(
+    raw: bytes,
+    header: Optional[List[str]],
+    delimiter: str,
+    encoding: str,
+    row: Optional[int] = None
+) -> Optional[Union[Dict[str, Any], ValidationError]]:
+    """Parse a raw record, returning an error on ``RECORD_FIELD`` if it cannot be."""
+    try:
+        record = _parse_raw_record(raw, header, delimiter, encoding)
+        if record is not None and not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        return record
+    except (ValueError, csv.Error) as e:
+        return ValidationError(
+            field=RECORD_FIELD,
+            value=raw.decode(encoding, errors='replace').rstrip('\r\n'),
+            message=f"Unparseable record: {e}",
+            row=row
+        )
+
+
+def _writer_kwargs(file_path: str, schema, quarantine: bool = False) -> Dict[str, Any]:
+    # Outputs of converted records always carry every schema column, typed
+    # from the schema rather than from whichever values come first.
+    # Quarantined rows keep their raw fields, and their values are exactly
+    # the ones whose types are wrong, so Parquet stores them as text
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.csv':
+        return {} if quarantine else {"fieldnames": [f.name for f in schema.fields]}
+    if suffix in ('.parquet', '.pq'):
+        return {"schema": schema, "as_text": quarantine}
+    return {}
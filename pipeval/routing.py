@@ -0,0 +1,174 @@
+"""Validate mixed record streams with one schema per record type."""
+
+from collections import Counter
+from typing import Any, AsyncIterable, Dict, List, Optional
+
+from .core import Schema, Field
+from .types import DataType, ValidationError, ValidationResult
+
+
+class RoutedResult(ValidationResult):
+    """ValidationResult with a breakdown per record type."""
+    
+    def __init__(
+        self,
+        result: ValidationResult,
+        type_counts: Dict[Any, int]
+    ):
+        super().__init__(
+            valid=result.valid,
+            errors=result.errors,
+            records_validated=result.records_validated,
+            profile=result.profile
+        )
+        errors_by_type: Dict[Any, List[ValidationError]] = {t: [] for t in type_counts}
+        for error in self.errors:
+            errors_by_type.setdefault(error.record_type, []).append(error)
+        self.by_type = {
+            record_type: ValidationResult(
+                valid=len(errors) == 0,
+                errors=errors,
+                records_validated=type_counts.get(record_type, 0)
+            )
+            for record_type, errors in errors_by_type.items()
+        }
+    
+    def to_dict(self):
+        data = super().to_dict()
+        data["by_type"] = {
+            str(record_type): {
+                "valid": result.valid,
+                "records_validated": result.records_validated,
+                "error_count": len(result.errors)
+            }
+            for record_type, result in self.by_type.items()
+        }
+        return data
+
+
+class SchemaRouter(Schema):
+    """Pick a Schema per record from a discriminator field.
+    
+    The discriminator value is looked up in a dispatch table built once
+    from ``schemas``; records with an unknown type use ``default`` or, if
+    there is none, fail with an error on the discriminator field, as do
+    records whose discriminator is a list or object. Errors carry the
+    record type in ``record_type``.
+    
+    A router is a Schema, so it can be passed where one is accepted (file
+    validators, ``route_file``, ``avalidate_stream``, SQLite tables); only
+    Parquet statistics pushdown, whose statistics cannot be split by type,
+    rejects it. Its fields are the discriminator followed by the union of
+    the routed schemas' fields, taking the first definition of each name;
+    names the routed schemas give different types are listed in
+    ``conflicting_fields`` and are written to Parquet as text. Profiles
+    count each record only under the fields of its own type. Every
+    validation path returns a RoutedResult with per-type results in
+    ``by_type``.
+    """
+    
+    def __init__(
+        self,
+        discriminator: str,
+        schemas: Dict[Any, Schema],
+        default: Optional[Schema] = None
+    ):
+        self.discriminator = discriminator
+        self.schemas = dict(schemas)
+        self.default = default
+        
+        fields = [Field(discriminator, DataType.STRING)]
+        types = {discriminator: {DataType.STRING}}
+        for schema in list(self.schemas.values()) + ([default] if default else []):
+            for field in schema.fields:
+                if field.name not in types:
+                    types[field.name] = set()
+                    fields.append(field)
+                types[field.name].add(field.data_type)
+        self.conflicting_fields = frozenset(
+            name for name, data_types in types.items() if len(data_types) > 1
+        )
+        super().__init__(fields)
+    
+    def record_type(self, record: Dict[str, Any]) -> Any:
+        """Return the discriminator value of a record (None if unhashable)."""
+        value = record.get(self.discriminator)
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return value
+    
+    def validate_record(
+        self,
+        record: Dict[str, Any],
+        row: Optional[int] = None
+    ) -> tuple:
+        """Validate a record against the schema for its type.
+        
+        Returns:
+            (errors_list, converted_record)
+        """
+        record_type = self.record_type(record)
+        if record_type is None and record.get(self.discriminator) is not None:
+            value = record[self.discriminator]
+            return [ValidationError(
+                field=self.discriminator,
+                value=value,
+                message=f"Record type must be a scalar, not {type(value).__name__}",
+                row=row
+            )], {}
+        schema = self.schemas.get(record_type, self.default)
+        if schema is None:
+            return [ValidationError(
+                field=self.discriminator,
+                value=record_type,
+                message=f"Unknown record type '{record_type}'",
+                row=row,
+                record_type=record_type
+            )], {}
+        
+        errors, converted = schema.validate_record(record, row=row)
+        for error in errors:
+            error.record_type = record_type
+        converted.setdefault(self.discriminator, record_type)
+        return errors, converted
+    
+    def validate_batch(
+        self,
+        records: List[Dict[str, Any]],
+        profile: bool = False,
+        instrument=False
+    ) -> RoutedResult:
+        """Validate multiple records, routing each by type.
+        
+        Returns:
+            RoutedResult
+        """
+        result = super().validate_batch(records, profile=profile, instrument=instrument)
+        routed = RoutedResult(result, Counter(map(self.record_type, records)))
+        routed.metrics = result.metrics
+        return routed
+    
+    async def avalidate_stream(
+        self,
+        records: AsyncIterable[Dict[str, Any]],
+        *args,
+        **kwargs
+    ) -> RoutedResult:
+        """Validate an async record stream, routing each record by type.
+        
+        Accepts the same arguments as ``Schema.avalidate_stream``.
+        
+        Returns:
+            RoutedResult
+        """
+        type_counts: Counter = Counter()
+        
+        async def counted():
+            async for record in records:
+                type_counts[self.record_type(record)] += 1
+                yield record
+        
+        result = await super().avalidate_stream(counted(), *args, **kwargs)
+        return RoutedResult(result, type_counts)
@@ -0,0 +1,172 @@
+"""Statistics for sampled validation runs."""
+
+import math
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional
+
+from .types import ValidationError
+
+
+def sample_size(confidence: float = 0.95, margin: float = 0.01) -> int:
+    """Records needed to estimate a rate within ``margin`` at ``confidence``.
+
+    Uses the worst case p = 0.5, so the bound holds for any error rate.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if not 0 < margin < 1:
+        raise ValueError("margin must be between 0 and 1")
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return int(math.ceil(z * z * 0.25 / (margin * margin)))
+
+
+def wilson_interval(failures: float, n: float, confidence: float = 0.95) -> tuple:
+    """Wilson score interval for a failure rate.
+
+    ``failures`` and ``n`` may be weighted (effective) counts.
+
+    Returns:
+        (rate, lower, upper)
+    """
+    if n == 0:
+        return 0.0, 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = failures / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    spread = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return p, max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+def weighted_failures(weights: List[float], failed: List[bool]) -> tuple:
+    """Express a weighted failure rate as an equivalent unweighted sample.
+
+    The rate is the weighted mean of ``failed``; the returned size ``n`` is
+    chosen so that p(1-p)/n equals the linearized variance of that ratio
+    estimate, so it can be passed to ``wilson_interval``.
+
+    Returns:
+        (failures, n) with failures / n the weighted failure rate
+    """
+    total = sum(weights)
+    if total == 0:
+        return 0.0, 0.0
+    p = sum(w for w, f in zip(weights, failed) if f) / total
+    residual = sum((w * (f - p)) ** 2 for w, f in zip(weights, failed))
+    if 0 < p < 1 and residual > 0:
+        n = p * (1 - p) * total * total / residual
+    else:
+        # Kish's effective size when the rate gives no variance to match
+        n = total * total / sum(w * w for w in weights)
+    return p * n, n
+
+
+def cluster_failures(
+    sizes: List[int],
+    failures: List[float],
+    clusters_total: Optional[int] = None
+) -> tuple:
+    """Express a failure rate from whole sampled clusters as an unweighted sample.
+
+    Clusters (such as Parquet row groups) are drawn at random and all of
+    their rows are checked, so rows are not independent draws. The
+    returned size ``n`` is chosen so that p(1-p)/n equals the
+    between-cluster linearized variance of the ratio estimate, with a
+    finite population correction when ``clusters_total`` is given. When
+    that variance is zero or cannot be estimated, each cluster counts as a
+    single observation.
+
+    Returns:
+        (failures, n) with failures / n the failure rate over all rows
+    """
+    m = len(sizes)
+    total = sum(sizes)
+    if total == 0:
+        return 0.0, 0.0
+    p = sum(failures) / total
+    n = float(m)
+    if m > 1 and 0 < p < 1:
+        residual = sum((f - p * s) ** 2 for s, f in zip(sizes, failures))
+        variance = m / (m - 1) * residual / (total * total)
+        if clusters_total:
+            variance *= 1 - m / clusters_total
+        if variance > 0:
+            n = p * (1 - p) / variance
+    return p * n, n
+
+
+class SampleResult:
+    """Estimated error rates from validating a random sample of a file.
+
+    For a weighted sample, ``row_failures`` and ``field_failures`` are
+    weighted counts on the scale of ``effective_size`` and
+    ``field_effective_sizes`` (see ``weighted_failures``), which the bounds
+    use in place of ``sample_size``.
+    """
+
+    def __init__(
+        self,
+        sample_size: int,
+        confidence: float,
+        row_failures: float,
+        field_failures: Dict[str, float],
+        errors: Optional[List[ValidationError]] = None,
+        bytes_read: int = 0,
+        bytes_total: int = 0,
+        exact: bool = False,
+        effective_size: Optional[float] = None,
+        field_effective_sizes: Optional[Dict[str, float]] = None
+    ):
+        self.sample_size = sample_size
+        self.confidence = confidence
+        self.row_failures = row_failures
+        self.field_failures = field_failures
+        self.errors = errors or []
+        self.bytes_read = bytes_read
+        self.bytes_total = bytes_total
+        self.exact = exact
+        self.effective_size = effective_size
+        self.field_effective_sizes = field_effective_sizes or {}
+
+    @property
+    def error_rate(self) -> Dict[str, float]:
+        """Estimated fraction of rows with at least one error, with bounds."""
+        return self._estimate(self.row_failures, self.effective_size)
+
+    @property
+    def field_error_rates(self) -> Dict[str, Dict[str, float]]:
+        """Estimated error rate per field, with bounds."""
+        return {
+            name: self._estimate(failures, self.field_effective_sizes.get(name))
+            for name, failures in self.field_failures.items()
+        }
+
+    def _estimate(self, failures: float, n: Optional[float]) -> Dict[str, float]:
+        if self.exact:
+            rate = failures / self.sample_size if self.sample_size else 0.0
+            return {"rate": rate, "lower": rate, "upper": rate}
+        if n is None:
+            n = self.sample_size
+        rate, lower, upper = wilson_interval(failures, n, self.confidence)
+        return {"rate": rate, "lower": lower, "upper": upper}
+
+    def __str__(self):
+        estimate = self.error_rate
+        return (
+            f"~{estimate['rate']:.2%} rows invalid "
+            f"[{estimate['lower']:.2%}, {estimate['upper']:.2%}] "
+            f"({self.sample_size} sampled)"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sample_size": self.sample_size,
+            "confidence": self.confidence,
+            "exact": self.exact,
+            "effective_size": self.effective_size,
+            "bytes_read": self.bytes_read,
+            "bytes_total": self.bytes_total,
+            "error_rate": self.error_rate,
+            "field_error_rates": self.field_error_rates,
+            "errors": [e.to_dict() for e in self.errors]
+        }
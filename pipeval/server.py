@@ -0,0 +1,228 @@
+"""Local HTTP validation server with warm, named schemas.
+
+Run with::
+
+    python -m pipeval.server --schemas myproject.schemas:SCHEMAS --port 8765
+
+where ``SCHEMAS`` is a dict mapping names to Schema objects. Clients POST a
+JSON list of records (or ``{"records": [...]}``) to ``/validate/<name>``
+over keep-alive connections and get back a compact result::
+
+    {"valid": false, "records": 3, "error_count": 1,
+     "errors": [[2, "id", "Required field"]]}
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .core import Schema
+
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class ValidationServer:
+    """Minimal asyncio HTTP/1.1 server that validates batches of records.
+
+    Schemas are built once at startup and shared by all requests. Bodies
+    of at least ``executor_body_size`` bytes are decoded, and batches of at
+    least ``executor_threshold`` records validated, in the loop's default
+    executor so large requests don't stall other connections. A validator
+    that raises gives a 500 response on a connection that stays open.
+    """
+
+    def __init__(
+        self,
+        schemas: Dict[str, Schema],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        unix_socket: Optional[str] = None,
+        max_body: int = 64 * 1024 * 1024,
+        max_errors: int = 1000,
+        executor_threshold: int = 1000,
+        executor_body_size: int = 1024 * 1024
+    ):
+        self.schemas = dict(schemas)
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.max_body = max_body
+        self.max_errors = max_errors
+        self.executor_threshold = executor_threshold
+        self.executor_body_size = executor_body_size
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> asyncio.AbstractServer:
+        """Start listening; with ``port=0`` the chosen port is stored in ``port``."""
+        if self.unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.unix_socket)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    def run(self) -> None:
+        """Serve until interrupted."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                length = int(headers.get("content-length", 0) or 0)
+                if length > self.max_body:
+                    await self._respond(writer, 413, {"error": "Request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self._dispatch(method, target, body)
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        keep_alive: bool
+    ) -> None:
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        path = urlsplit(target).path.rstrip("/")
+
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/schemas":
+            return 200, {name: schema.to_dict() for name, schema in self.schemas.items()}
+        if not path.startswith("/validate/"):
+            return 404, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+
+        name = path[len("/validate/"):]
+        schema = self.schemas.get(name)
+        if schema is None:
+            return 404, {"error": f"Unknown schema: {name}"}
+
+        loop = asyncio.get_running_loop()
+        try:
+            if len(body) >= self.executor_body_size:
+                data = await loop.run_in_executor(None, json.loads, body)
+            else:
+                data = json.loads(body or b"[]")
+        except ValueError as e:
+            return 400, {"error": f"Invalid JSON: {e}"}
+        records = data.get("records") if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            return 400, {"error": "Expected a list of records"}
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                return 400, {"error": f"Record {i} is not a JSON object"}
+
+        if len(records) >= self.executor_threshold:
+            result = await loop.run_in_executor(None, schema.validate_batch, records)
+        else:
+            result = schema.validate_batch(records)
+
+        return 200, {
+            "valid": result.valid,
+            "records": result.records_validated,
+            "error_count": len(result.errors),
+            "errors": [
+                [e.row, e.field, e.message] for e in result.errors[:self.max_errors]
+            ],
+        }
+
+
+def load_schemas(spec: str) -> Dict[str, Schema]:
+    """Load a ``module:attribute`` dict of named schemas."""
+    module_name, _, attribute = spec.partition(":")
+    module = importlib.import_module(module_name)
+    schemas = getattr(module, attribute or "SCHEMAS")
+    if not isinstance(schemas, dict):
+        raise ValueError(f"{spec} is not a dict of schemas")
+    return schemas
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run a pipeval validation server.")
+    parser.add_argument("--schemas", required=True, help="module:attribute dict of schemas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", help="Listen on a Unix socket instead of TCP")
+    args = parser.parse_args(argv)
+
+    server = ValidationServer(
+        load_schemas(args.schemas),
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket
+    )
+    server.run()
+
+
+if __name__ == "__main__":
+    main()
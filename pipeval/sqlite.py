@@ -0,0 +1,282 @@
+"""Validate SQLite tables with checks pushed down into SQL."""
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .pushdown import EXACT_FLOAT_LIMIT, NUMERIC_TYPES
+from .routing import RoutedResult, SchemaRouter
+from .types import DataType, ValidationResult
+
+
+# Values Field._convert_type accepts for BOOLEAN, after str().lower()
+BOOLEAN_TEXT = ('true', '1', 'yes', 'y', 'false', '0', 'no', 'n')
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def suspect_predicate(field, column: str) -> Optional[Tuple[str, List[Any]]]:
+    """Build a SQL predicate that is true for every row ``field`` could reject.
+
+    Missing values, type conversion, numeric bounds, ``one_of`` and string
+    length checks are translated into SQL. Values whose Python conversion
+    SQL cannot mirror exactly (numbers stored as text, numbers beyond
+    2**53) are always matched. The predicate may match rows that pass,
+    since matched rows are re-validated in Python; it never misses a row
+    that fails.
+
+    Args:
+        field: Field to translate
+        column: Quoted column expression
+
+    Returns:
+        (sql, params), or None if no row can fail
+    """
+    missing = f"({column} IS NULL OR {column} = '')"
+    checks: List[str] = []
+    params: List[Any] = []
+    python_side = False
+
+    if field.data_type in NUMERIC_TYPES:
+        value = f"CAST({column} AS INTEGER)" if field.data_type == DataType.INTEGER else column
+        for validator in field.validators:
+            rule = getattr(validator, "rule", None)
+            args = getattr(validator, "params", ())
+            if rule == "required":
+                continue
+            if rule == "minimum":
+                checks.append(f"{value} < ?")
+                params.append(args[0])
+            elif rule == "maximum":
+                checks.append(f"{value} > ?")
+                params.append(args[0])
+            elif rule == "range_check":
+                checks.append(f"({value} < ? OR {value} > ?)")
+                params.extend(args)
+            elif rule == "one_of":
+                allowed = [a for a in args[0] if isinstance(a, (int, float))]
+                checks.append(_not_in(value, allowed, params))
+            else:
+                python_side = True
+                break
+        if not python_side:
+            # Text that may or may not parse as a number, and numbers that
+            # float() would round (where CAST(... AS INTEGER) also
+            # saturates at 2**63 - 1), are left to Python
+            checks[:0] = [
+                f"typeof({column}) NOT IN ('integer', 'real')",
+                f"({column} > {EXACT_FLOAT_LIMIT} OR {column} < -{EXACT_FLOAT_LIMIT})",
+            ]
+    elif field.data_type == DataType.STRING:
+        for validator in field.validators:
+            rule = getattr(validator, "rule", None)
+            args = getattr(validator, "params", ())
+            if rule == "required":
+                continue
+            if rule == "min_length":
+                checks.append(f"length({column}) < ?")
+                params.append(args[0])
+            elif rule == "max_length":
+                # length() stops at a NUL character; the UTF-8 byte length
+                # never undercounts the characters Python sees
+                checks.append(f"length(CAST({column} AS BLOB)) > ?")
+                params.append(args[0])
+            elif rule == "one_of":
+                allowed = [a for a in args[0] if isinstance(a, str)]
+                checks.append(_not_in(column, allowed, params))
+            else:
+                python_side = True
+                break
+        if checks and not python_side:
+            # Only text values have a length equal to their Python str()
+            checks.insert(0, f"typeof({column}) != 'text'")
+    else:
+        python_side = any(getattr(v, "rule", None) != "required" for v in field.validators)
+        if field.data_type == DataType.BOOLEAN:
+            # Values that would fail conversion to bool
+            checks.append(
+                f"NOT (typeof({column}) = 'integer' AND {column} IN (0, 1)) "
+                f"AND NOT (typeof({column}) = 'text' AND lower({column}) IN "
+                f"({', '.join('?' * len(BOOLEAN_TEXT))}))"
+            )
+            params.extend(BOOLEAN_TEXT)
+
+    if python_side:
+        # Every present value has to be checked in Python
+        return ("1", []) if field.required else (f"NOT {missing}", [])
+
+    parts = []
+    if field.required:
+        parts.append(missing)
+    if checks:
+        parts.append(f"(NOT {missing} AND ({' OR '.join(checks)}))")
+    if not parts:
+        return None
+    return " OR ".join(parts), params
+
+
+def _schema_predicates(schema, table_columns) -> List[Tuple[str, List[Any]]]:
+    """Suspect predicates for the fields of a plain Schema."""
+    predicates = []
+    for field in schema.fields:
+        if field.name in table_columns:
+            predicate = suspect_predicate(field, _quote(field.name))
+        else:
+            # Absent columns read as None
+            predicate = ("1", []) if field.required else None
+        if predicate is not None:
+            predicates.append(predicate)
+    return predicates
+
+
+def _router_predicates(router, table_columns) -> List[Tuple[str, List[Any]]]:
+    """Suspect predicates for a SchemaRouter, each limited to its record type."""
+    if router.discriminator in table_columns:
+        column = _quote(router.discriminator)
+    else:
+        column = "NULL"
+
+    conditions = [_type_condition(column, t) for t in router.schemas]
+    if any(condition is None for condition in conditions):
+        # A type key SQL cannot compare like Python: check every row there
+        return [("1", [])]
+
+    predicates = []
+    for (condition, condition_params), schema in zip(conditions, router.schemas.values()):
+        for sql, params in _schema_predicates(schema, table_columns):
+            predicates.append((f"{condition} AND ({sql})", condition_params + params))
+
+    if conditions:
+        unknown = f"NOT ({' OR '.join(c for c, _ in conditions)})"
+        unknown_params = [p for _, params in conditions for p in params]
+    else:
+        unknown, unknown_params = "1", []
+    if router.default is None:
+        # Unknown types always fail
+        predicates.append((unknown, unknown_params))
+    else:
+        for sql, params in _schema_predicates(router.default, table_columns):
+            predicates.append((f"{unknown} AND ({sql})", unknown_params + params))
+    return predicates
+
+
+def _type_condition(column: str, record_type: Any) -> Optional[Tuple[str, List[Any]]]:
+    """SQL that is true exactly when a dict lookup would pick ``record_type``."""
+    if record_type is None:
+        return f"{column} IS NULL", []
+    if isinstance(record_type, str):
+        # Same storage class, so column affinity cannot convert either side
+        return f"(typeof({column}) = 'text' AND {column} = ?)", [record_type]
+    if isinstance(record_type, (int, float)) and abs(record_type) <= EXACT_FLOAT_LIMIT:
+        return f"(typeof({column}) IN ('integer', 'real') AND {column} = ?)", [record_type]
+    return None
+
+
+def _not_in(value: str, allowed: List[Any], params: List[Any]) -> str:
+    if not allowed:
+        return "1"
+    params.extend(allowed)
+    return f"{value} NOT IN ({', '.join('?' * len(allowed))})"
+
+
+class SQLiteValidator:
+    """Validate SQLite tables without moving clean rows into Python."""
+
+    @staticmethod
+    def validate_table(
+        schema,
+        database: Union[str, sqlite3.Connection],
+        table: str,
+        batch_size: int = 1000
+    ) -> ValidationResult:
+        """Validate a table against schema.
+
+        One aggregate query counts, per field, the rows that could fail its
+        pushed-down checks. Only rows matched by a field with a nonzero
+        count are then fetched (schema columns only, through ``fetchmany``)
+        and validated in Python, so reported errors are identical to
+        ``schema.validate_batch`` over ``SELECT *``. Rows are numbered in
+        table scan order. For a SchemaRouter each type's checks are limited
+        to rows of that type, and rows of unknown types are always fetched
+        unless there is a default schema, and the result is a RoutedResult
+        with rows counted per type.
+
+        Args:
+            schema: Schema object
+            database: Path to a SQLite file or an open connection
+            table: Table name
+            batch_size: Rows per fetchmany call
+
+        Returns:
+            ValidationResult, or a RoutedResult for a SchemaRouter
+        """
+        owns_connection = not isinstance(database, sqlite3.Connection)
+        conn = sqlite3.connect(database) if owns_connection else database
+        try:
+            return SQLiteValidator._validate(schema, conn, table, batch_size)
+        finally:
+            if owns_connection:
+                conn.close()
+
+    @staticmethod
+    def _validate(schema, conn: sqlite3.Connection, table: str, batch_size: int):
+        quoted_table = _quote(table)
+        table_columns = {
+            row[1] for row in conn.execute(f"PRAGMA table_info({quoted_table})")
+        }
+        if not table_columns:
+            raise ValueError(f"Table not found: {table}")
+        columns = [f.name for f in schema.fields if f.name in table_columns]
+
+        if isinstance(schema, SchemaRouter):
+            predicates = _router_predicates(schema, table_columns)
+        else:
+            predicates = _schema_predicates(schema, table_columns)
+
+        counts_sql = ", ".join(
+            f"SUM(CASE WHEN {sql} THEN 1 ELSE 0 END)" for sql, _ in predicates
+        )
+        params = [p for _, field_params in predicates for p in field_params]
+        select = f"SELECT COUNT(*){', ' + counts_sql if counts_sql else ''} FROM {quoted_table}"
+        row = conn.execute(select, params).fetchone()
+        records_validated = row[0]
+
+        active = [pred for pred, count in zip(predicates, row[1:]) if count]
+        all_errors = []
+        if active:
+            where = " OR ".join(f"({sql})" for sql, _ in active)
+            params = [p for _, field_params in active for p in field_params]
+            projected = ", ".join(_quote(name) for name in columns)
+            query = (
+                f"SELECT * FROM (SELECT ROW_NUMBER() OVER () AS __pipeval_row"
+                f"{', ' + projected if projected else ''} FROM {quoted_table}) "
+                f"WHERE {where}"
+            )
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for fetched in rows:
+                    record: Dict[str, Any] = dict(zip(columns, fetched[1:]))
+                    errors, _ = schema.validate_record(record, row=fetched[0])
+                    all_errors.extend(errors)
+
+        result = ValidationResult(
+            valid=len(all_errors) == 0,
+            errors=all_errors,
+            records_validated=records_validated
+        )
+        if not isinstance(schema, SchemaRouter):
+            return result
+        if schema.discriminator in table_columns:
+            # GROUP BY compares like a dict lookup: 1 and 1.0 meet, '1' does not
+            discriminator = _quote(schema.discriminator)
+            type_counts = dict(conn.execute(
+                f"SELECT {discriminator}, COUNT(*) FROM {quoted_table} "
+                f"GROUP BY {discriminator}"
+            ))
+        else:
+            type_counts = {None: records_validated}
+        return RoutedResult(result, type_counts)
@@ -1,6 +1,6 @@
 """Type system for validators."""
 
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 
@@ -24,12 +24,14 @@ class ValidationError:
         field: str, 
         value: Any, 
         message: str, 
-        row: Optional[int] = None
+        row: Optional[int] = None,
+        record_type: Optional[Any] = None
     ):
         self.field = field
         self.value = value
         self.message = message
         self.row = row
+        self.record_type = record_type
     
     def __str__(self):
         if self.row is not None:
@@ -40,12 +42,15 @@ class ValidationError:
         return f"ValidationError(field={self.field}, row={self.row}, message={self.message})"
     
     def to_dict(self):
-        return {
+        data = {
             "field": self.field,
             "value": str(self.value)[:100],
             "message": self.message,
             "row": self.row
         }
+        if self.record_type is not None:
+            data["record_type"] = self.record_type
+        return data
 
 
 class ValidationResult:
@@ -55,11 +60,15 @@ class ValidationResult:
         self, 
         valid: bool, 
         errors: Optional[List[ValidationError]] = None,
-        records_validated: int = 0
+        records_validated: int = 0,
+        profile: Optional[Any] = None,
+        metrics: Optional[Dict[str, Any]] = None
     ):
         self.valid = valid
         self.errors = errors or []
         self.records_validated = records_validated
+        self.profile = profile
+        self.metrics = metrics
     
     def __str__(self):
         if self.valid:
@@ -67,12 +76,17 @@ class ValidationResult:
         return f"✗ Invalid ({len(self.errors)} errors)"
     
     def to_dict(self):
-        return {
+        data = {
             "valid": self.valid,
             "records_validated": self.records_validated,
             "error_count": len(self.errors),
             "errors": [e.to_dict() for e in self.errors]
         }
+        if self.profile is not None:
+            data["profile"] = self.profile.to_dict()
+        if self.metrics is not None:
+            data["metrics"] = self.metrics
+        return data
     
     def summary(self):
         """Return a human-readable summary."""
@@ -5,6 +5,13 @@ from datetime import datetime
 from typing import Callable
 
 
+def _rule(validate: Callable, name: str, *params) -> Callable:
+    """Tag a validator with the rule it implements so it can be pushed down."""
+    validate.rule = name
+    validate.params = params
+    return validate
+
+
 class Validators:
     """Collection of reusable validators."""
     
@@ -15,7 +22,7 @@ class Validators:
             if value is None or value == "" or value == []:
                 return False, "Required field cannot be empty"
             return True, None
-        return validate
+        return _rule(validate, "required")
     
     @staticmethod
     def min_length(length: int) -> Callable:
@@ -26,7 +33,7 @@ class Validators:
             if len(value) < length:
                 return False, f"String must be at least {length} characters (got {len(value)})"
             return True, None
-        return validate
+        return _rule(validate, "min_length", length)
     
     @staticmethod
     def max_length(length: int) -> Callable:
@@ -37,7 +44,7 @@ class Validators:
             if len(value) > length:
                 return False, f"String must not exceed {length} characters (got {len(value)})"
             return True, None
-        return validate
+        return _rule(validate, "max_length", length)
     
     @staticmethod
     def email() -> Callable:
@@ -49,7 +56,7 @@ class Validators:
             if not re.match(pattern, value):
                 return False, "Invalid email format"
             return True, None
-        return validate
+        return _rule(validate, "email")
     
     @staticmethod
     def range_check(min_val: float, max_val: float) -> Callable:
@@ -63,7 +70,7 @@ class Validators:
             if num < min_val or num > max_val:
                 return False, f"Value must be between {min_val} and {max_val}, got {num}"
             return True, None
-        return validate
+        return _rule(validate, "range_check", min_val, max_val)
     
     @staticmethod
     def one_of(allowed: list) -> Callable:
@@ -73,7 +80,7 @@ class Validators:
                 allowed_str = ", ".join(map(str, allowed))
                 return False, f"Value must be one of: {allowed_str}. Got '{value}'"
             return True, None
-        return validate
+        return _rule(validate, "one_of", allowed)
     
     @staticmethod
     def regex(pattern: str, name: str = "pattern") -> Callable:
@@ -84,7 +91,7 @@ class Validators:
             if not re.match(pattern, value):
                 return False, f"Value does not match {name}"
             return True, None
-        return validate
+        return _rule(validate, "regex", pattern, name)
     
     @staticmethod
     def url() -> Callable:
@@ -96,7 +103,7 @@ class Validators:
             if not re.match(pattern, value):
                 return False, "Invalid URL format"
             return True, None
-        return validate
+        return _rule(validate, "url")
     
     @staticmethod
     def phone() -> Callable:
@@ -110,7 +117,7 @@ class Validators:
             if len(cleaned) < 10 or len(cleaned) > 15:
                 return False, "Invalid phone format"
             return True, None
-        return validate
+        return _rule(validate, "phone")
     
     @staticmethod
     def minimum(min_val: float) -> Callable:
@@ -123,7 +130,7 @@ class Validators:
             if num < min_val:
                 return False, f"Value must be >= {min_val}"
             return True, None
-        return validate
+        return _rule(validate, "minimum", min_val)
     
     @staticmethod
     def maximum(max_val: float) -> Callable:
@@ -136,4 +143,4 @@ class Validators:
             if num > max_val:
                 return False, f"Value must be <= {max_val}"
             return True, None
-        return validate
+        return _rule(validate, "maximum", max_val)
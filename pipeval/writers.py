@@ -0,0 +1,280 @@
+"""Batched file writers for multiple formats."""
+
+import csv
+import json
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+
+from .types import DataType
+
+
+class RecordWriter:
+    """Base class for writers that buffer records and flush them in batches."""
+
+    def __init__(self, file_path: str, batch_size: int = 1000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.file_path = str(file_path)
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Buffer a record, flushing when the batch is full."""
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered records to the output file."""
+        if not self._buffer:
+            return
+        self._write_batch(self._buffer)
+        self.records_written += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> None:
+        """Flush remaining records and release the output file."""
+        try:
+            self.flush()
+        finally:
+            self._close()
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CSVWriter(RecordWriter):
+    """Write records to a CSV file.
+
+    The header is taken from ``fieldnames`` or, if omitted, from the keys
+    of the first record written. A record with a key outside the header
+    raises ValueError rather than losing that value; extra values that
+    csv.DictReader collected under the ``None`` key are written after the
+    header columns, as in the original row. Non-string values (lists,
+    dicts) are serialized as JSON.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        batch_size: int = 1000,
+        fieldnames: Optional[List[str]] = None,
+        delimiter: str = ',',
+        encoding: str = 'utf-8'
+    ):
+        super().__init__(file_path, batch_size)
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.delimiter = delimiter
+        self._file = open(self.file_path, 'w', encoding=encoding, newline='')
+        self._writer = None
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = [k for k in records[0] if k is not None]
+            self._writer = csv.writer(self._file, delimiter=self.delimiter)
+            self._writer.writerow(self.fieldnames)
+        known = set(self.fieldnames)
+        rows = []
+        for record in records:
+            extra = [k for k in record if k is not None and k not in known]
+            if extra:
+                raise ValueError(
+                    f"Record has fields not in the CSV header: {', '.join(map(str, extra))}. "
+                    "Pass fieldnames or write to .jsonl to keep varying fields."
+                )
+            row = [_csv_value(record.get(name, "")) for name in self.fieldnames]
+            row.extend(_csv_value(v) for v in record.get(None) or [])
+            rows.append(row)
+        self._writer.writerows(rows)
+
+    def _close(self) -> None:
+        if self._writer is None and self.fieldnames is not None:
+            # Empty output still gets a header so downstream readers work
+            csv.writer(self._file, delimiter=self.delimiter).writerow(self.fieldnames)
+        self._file.close()
+
+
+class JSONLWriter(RecordWriter):
+    """Write records to a JSON Lines file (one JSON object per line)."""
+
+    def __init__(self, file_path: str, batch_size: int = 1000, encoding: str = 'utf-8'):
+        super().__init__(file_path, batch_size)
+        self._file = open(self.file_path, 'w', encoding=encoding)
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        self._file.write(
+            "".join(json.dumps(record, default=str) + "\n" for record in records)
+        )
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(RecordWriter):
+    """Write records to a Parquet file, one row group per batch.
+    
+    With ``schema``, columns for STRING, INTEGER, FLOAT and BOOLEAN fields
+    get the matching Arrow type, so an optional field that is empty in the
+    first batch still accepts values later, and an empty output still has
+    the schema's columns. Other columns are inferred
+    from the first batch. With ``as_text``, every column is stored as a
+    string (JSON for non-string values), for rows such as quarantined ones
+    whose value types cannot be trusted; a SchemaRouter's
+    ``conflicting_fields``, which hold values of several types, are
+    always stored this way. As with CSVWriter, a record with
+    a field outside the columns of the first batch raises ValueError.
+    
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    
+    def __init__(
+        self,
+        file_path: str,
+        batch_size: int = 1000,
+        schema=None,
+        as_text: bool = False
+    ):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for Parquet support. "
+                "Install with: pip install pipeval[parquet]"
+            )
+        super().__init__(file_path, batch_size)
+        self._pa = pa
+        self._pq = pq
+        self.as_text = as_text
+        self._types = {}
+        self._fieldnames = None
+        self._text_fields = frozenset(getattr(schema, "conflicting_fields", ()))
+        if schema is not None:
+            arrow_types = {
+                DataType.STRING: pa.string(),
+                DataType.INTEGER: pa.int64(),
+                DataType.FLOAT: pa.float64(),
+                DataType.BOOLEAN: pa.bool_(),
+            }
+            self._fieldnames = [f.name for f in schema.fields]
+            self._types = {
+                f.name: (
+                    pa.string() if as_text or f.name in self._text_fields
+                    else arrow_types[f.data_type]
+                )
+                for f in schema.fields
+                if as_text or f.name in self._text_fields or f.data_type in arrow_types
+            }
+        self._writer = None
+    
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        if self.as_text:
+            records = [
+                {_text_key(k): _text_value(v) for k, v in record.items()}
+                for record in records
+            ]
+        elif self._text_fields:
+            records = [
+                {
+                    k: _text_value(v) if k in self._text_fields else v
+                    for k, v in record.items()
+                }
+                for record in records
+            ]
+        if self._writer is None:
+            # Columns are the union of the batch's keys, in first-seen order
+            names = list(dict.fromkeys(k for record in records for k in record))
+            inferred = self._pa.Table.from_pydict(
+                {name: [record.get(name) for record in records] for name in names}
+            ).schema
+            arrow_schema = self._pa.schema([
+                self._pa.field(
+                    f.name,
+                    self._types.get(f.name, self._pa.string() if self.as_text else f.type)
+                )
+                for f in inferred
+            ])
+            self._writer = self._pq.ParquetWriter(self.file_path, arrow_schema)
+        known = set(self._writer.schema.names)
+        for record in records:
+            extra = [k for k in record if k not in known]
+            if extra:
+                raise ValueError(
+                    f"Record has fields not in the Parquet schema: {', '.join(map(str, extra))}. "
+                    "Write to .jsonl to keep varying fields."
+                )
+        table = self._pa.Table.from_pylist(records, schema=self._writer.schema)
+        self._writer.write_table(table)
+    
+    def _close(self) -> None:
+        if self._writer is None:
+            # Empty output is still a readable file, with the schema's
+            # columns when they are known, like CSVWriter's header
+            arrow_schema = self._pa.schema([
+                self._pa.field(name, self._types.get(name, self._pa.null()))
+                for name in self._fieldnames or []
+            ])
+            self._writer = self._pq.ParquetWriter(self.file_path, arrow_schema)
+        self._writer.close()
+
+
+class FileWriter:
+    """Open batched writers by file extension."""
+
+    @staticmethod
+    def open(file_path: str, batch_size: int = 1000, **kwargs) -> RecordWriter:
+        """Open a writer, detecting the format from the file extension.
+
+        Args:
+            file_path: Path to output file
+            batch_size: Number of records buffered per write
+            **kwargs: Additional arguments for specific writers
+
+        Returns:
+            RecordWriter
+
+        Raises:
+            ValueError: If file format is not supported
+        """
+        suffix = Path(file_path).suffix.lower()
+
+        if suffix == '.csv':
+            return CSVWriter(file_path, batch_size, **kwargs)
+        elif suffix in ('.jsonl', '.ndjson'):
+            return JSONLWriter(file_path, batch_size, **kwargs)
+        elif suffix == '.parquet' or suffix == '.pq':
+            return ParquetWriter(file_path, batch_size, **kwargs)
+        else:
+            raise ValueError(
+                f"Unsupported output format: {suffix}. "
+                "Supported: .csv, .jsonl, .parquet"
+            )
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _text_key(key: Any) -> str:
+    # csv.DictReader's overflow key, named as JSONLWriter writes it
+    return "null" if key is None else str(key)
+
+
+def _text_value(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
@@ -1,7 +1,11 @@
 """Tests for core validation engine."""
 
+import asyncio
+import time
+
 import pytest
 from pipeval import Schema, Field, DataType, Validators
+from pipeval.core import AdaptiveOrder
 
 
 def test_basic_validation():
@@ -156,3 +160,128 @@ def test_schema_export():
     assert len(schema_dict["fields"]) == 2
     assert schema_dict["fields"][0]["name"] == "id"
     assert schema_dict["fields"][0]["required"] is True
+
+
+def test_adaptive_validator_ordering():
+    """Test adaptive mode moves frequently-failing validators first."""
+    calls = []
+    
+    def expensive(value):
+        calls.append(value)
+        return True, None
+    
+    field = Field("status", DataType.STRING, adaptive=True, exact_errors=False, validators=[
+        expensive,
+        Validators.one_of(["active"]),
+    ])
+    
+    for _ in range(512):
+        field.validate("pending")
+    
+    stats = field.adaptive_order.stats()
+    assert stats[1]["position"] == 0
+    assert len(calls) < 512
+
+
+def test_adaptive_errors_are_deterministic():
+    """Test adaptive mode reports the declared-first failing validator."""
+    schema = Schema([
+        Field("name", DataType.STRING, validators=[
+            Validators.min_length(5),
+            Validators.one_of(["alice", "bobby"]),
+        ]),
+    ], adaptive=True)
+    
+    for _ in range(300):
+        schema.validate_record({"name": "carol"})
+    assert schema.field_map["name"].adaptive_order.order == [1, 0]
+    
+    errors, _ = schema.validate_record({"name": "al"})
+    assert len(errors) == 1
+    assert "at least 5" in errors[0].message
+
+
+def test_adaptive_reorder_keeps_order_visible():
+    """Test check() in another thread never sees a half-sorted, empty order."""
+    order = AdaptiveOrder([Validators.min_length(1), Validators.max_length(9)])
+    seen = []
+    rank = order._rank
+    
+    def spying_rank(i):
+        seen.append(list(order.order))
+        return rank(i)
+    
+    order._rank = spying_rank
+    order.reorder()
+    assert seen and all(sorted(s) == [0, 1] for s in seen)
+
+
+def test_adaptive_schema_leaves_shared_fields_alone():
+    """Test Schema(adaptive=True) does not change the caller's fields."""
+    field = Field("name", DataType.STRING, validators=[
+        Validators.min_length(1),
+        Validators.max_length(9),
+    ])
+    adaptive = Schema([field], adaptive=True)
+    plain = Schema([field])
+    
+    assert adaptive.field_map["name"].adaptive
+    assert not field.adaptive
+    assert plain.field_map["name"] is field
+
+
+def test_avalidate_stream():
+    """Test async stream validation with row numbers across batches."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+    ])
+    
+    async def source():
+        for i in range(10):
+            yield {"id": "" if i == 7 else i}
+    
+    result = asyncio.run(schema.avalidate_stream(source(), batch_size=3))
+    assert not result.valid
+    assert result.records_validated == 10
+    assert result.errors[0].row == 8
+
+
+def test_avalidate_stream_backpressure():
+    """Test a slow validator bounds how far the producer runs ahead."""
+    validated = []
+    
+    def slow(value):
+        time.sleep(0.001)
+        validated.append(value)
+        return True, None
+    
+    schema = Schema([
+        Field("id", DataType.INTEGER, validators=[slow]),
+    ])
+    max_lead = 0
+    
+    async def source():
+        nonlocal max_lead
+        for i in range(200):
+            max_lead = max(max_lead, i - len(validated))
+            yield {"id": i}
+    
+    result = asyncio.run(
+        schema.avalidate_stream(source(), batch_size=10, max_pending=2)
+    )
+    assert result.valid
+    assert result.records_validated == 200
+    # Queued batches + the batch being validated + the batch being filled
+    assert max_lead <= 10 * (2 + 2)
+
+
+def test_avalidate_stream_source_error():
+    """Test errors raised by the async source propagate."""
+    schema = Schema([Field("id", DataType.INTEGER)])
+    
+    async def source():
+        yield {"id": 1}
+        raise RuntimeError("connection lost")
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(schema.avalidate_stream(source()))
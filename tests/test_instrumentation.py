@@ -0,0 +1,106 @@
+"""Tests for memory and allocation instrumentation."""
+
+import tracemalloc
+
+import pytest
+from pipeval import Schema, SchemaRouter, Field, DataType, Validators
+from pipeval.instrumentation import Instrumentation
+from pipeval.readers import FileValidator
+
+
+STAGE_KEYS = {
+    "seconds", "allocated_bytes", "peak_bytes", "net_blocks", "rss_bytes", "peak_rss_bytes"
+}
+
+
+@pytest.fixture
+def temp_csv(tmp_path):
+    """Create a CSV file with an unchecked extra column."""
+    path = tmp_path / "data.csv"
+    path.write_text("id,tag,wide\n1,a,x\n2,z,x\n")
+    return str(path)
+
+
+def make_schema():
+    return Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("tag", DataType.STRING, validators=[Validators.one_of(["a", "b"])]),
+    ])
+
+
+def test_instrumented_batch_matches_plain():
+    """Test instrumented validation gives the same errors plus metrics."""
+    records = [{"id": str(i), "tag": "c" if i % 5 == 0 else "a"} for i in range(200)]
+    records.append({"id": "", "tag": "b"})
+    schema = make_schema()
+    
+    plain = schema.validate_batch(records)
+    measured = schema.validate_batch(records, instrument=True)
+    
+    assert [str(e) for e in measured.errors] == [str(e) for e in plain.errors]
+    assert plain.metrics is None
+    assert set(measured.metrics) == {"validate", "result"}
+    assert STAGE_KEYS <= set(measured.metrics["validate"])
+    assert measured.metrics["validate"]["peak_bytes"] > 0
+    assert measured.metrics["validate"]["net_blocks"] is None
+    assert "metrics" in measured.to_dict()
+    assert not tracemalloc.is_tracing()
+
+
+def test_instrumented_file_read_stage(temp_csv):
+    """Test file validation reports a read stage labelled by format."""
+    result = FileValidator.validate_csv_file(make_schema(), temp_csv, instrument=True)
+    
+    assert result.metrics["read"]["format"] == "csv"
+    assert list(result.metrics) == ["read", "validate", "result"]
+
+
+def test_instrumented_router():
+    """Test schemas overriding validate_record are measured on the same path."""
+    router = SchemaRouter("type", {"x": make_schema()})
+    result = router.validate_batch([{"type": "x", "id": 1, "tag": "a"}], instrument=True)
+    
+    assert set(result.metrics) == {"validate", "result"}
+    assert result.by_type["x"].records_validated == 1
+
+
+def test_instrumented_path_is_production_path(monkeypatch):
+    """Test instrumentation measures the same single pass as plain validation."""
+    schema = make_schema()
+    calls = []
+    validate_rows = Schema._validate_rows
+    
+    def spy(self, *args, **kwargs):
+        calls.append(args[0])
+        return validate_rows(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Schema, "_validate_rows", spy)
+    records = [{"id": "1", "tag": "a"}]
+    schema.validate_batch(records)
+    schema.validate_batch(records, instrument=True, profile=True)
+    assert calls == [records, records]
+
+
+def test_count_blocks():
+    """Test block counting is opt-in."""
+    instrumentation = Instrumentation(count_blocks=True)
+    with instrumentation.stage("build"):
+        kept = [object() for _ in range(1000)]
+    instrumentation.stop()
+    
+    assert instrumentation.to_dict()["build"]["net_blocks"] >= 1000
+    assert len(kept) == 1000
+
+
+def test_stages_accumulate():
+    """Test repeated stages add up."""
+    instrumentation = Instrumentation()
+    for _ in range(2):
+        with instrumentation.stage("read", format="jsonl"):
+            [0] * 1000
+    instrumentation.stop()
+    
+    read = instrumentation.to_dict()["read"]
+    assert read["format"] == "jsonl"
+    assert read["net_blocks"] is None
+    assert read["seconds"] > 0
@@ -0,0 +1,117 @@
+"""Tests for column profiling."""
+
+import pickle
+import random
+
+from pipeval import Schema, Field, DataType, Validators
+from pipeval.profiling import HyperLogLog, KLLSketch, RunningStats
+
+
+def test_hyperloglog_estimate():
+    """Test distinct count estimate is within a few percent."""
+    hll = HyperLogLog()
+    for i in range(50000):
+        hll.add(i % 20000)
+    
+    assert abs(hll.count() - 20000) / 20000 < 0.05
+
+
+def test_hyperloglog_merge():
+    """Test merging sketches of overlapping shards."""
+    a, b = HyperLogLog(), HyperLogLog()
+    for i in range(1000):
+        a.add(i)
+        b.add(i + 500)
+    a.merge(b)
+    
+    assert abs(a.count() - 1500) / 1500 < 0.05
+
+
+def test_kll_quantiles():
+    """Test quantile estimates and merge."""
+    values = list(range(20000))
+    random.Random(1).shuffle(values)
+    a, b = KLLSketch(seed=1), KLLSketch(seed=2)
+    for v in values[:10000]:
+        a.add(v)
+    for v in values[10000:]:
+        b.add(v)
+    a.merge(b)
+    
+    assert a.count == 20000
+    assert abs(a.quantile(0.5) - 10000) < 400
+    assert abs(a.quantile(0.99) - 19800) < 400
+
+
+def test_running_stats_merge():
+    """Test Welford stats merge matches a single pass."""
+    a, b, whole = RunningStats(), RunningStats(), RunningStats()
+    for v in [1.0, 2.0, 3.0]:
+        a.add(v)
+        whole.add(v)
+    for v in [10.0, 20.0]:
+        b.add(v)
+        whole.add(v)
+    a.merge(b)
+    
+    assert a.mean == whole.mean
+    assert abs(a.variance - whole.variance) < 1e-9
+
+
+def test_validate_batch_profile():
+    """Test profiling during batch validation."""
+    schema = Schema([
+        Field("age", DataType.INTEGER, validators=[Validators.range_check(0, 150)]),
+        Field("city", DataType.STRING),
+    ])
+    records = [
+        {"age": "30", "city": "Paris"},
+        {"age": "", "city": "Paris"},
+        {"age": "200", "city": "Rome"},
+        {"age": "40", "city": ""},
+    ]
+    
+    result = schema.validate_batch(records, profile=True)
+    age = result.profile["age"].to_dict()
+    assert age["count"] == 4
+    assert age["null_rate"] == 0.25
+    assert age["invalid_count"] == 1
+    assert (age["min"], age["max"]) == (30, 40)
+    assert age["mean"] == 35
+    
+    city = result.to_dict()["profile"]["city"]
+    assert city["distinct_count"] == 2
+    assert city["quantiles"] == {}
+
+
+def test_profile_merge_shards():
+    """Test partial profiles from shards merge into one."""
+    schema = Schema([Field("n", DataType.INTEGER)])
+    shard_a = schema.validate_batch([{"n": i} for i in range(100)], profile=True)
+    shard_b = schema.validate_batch([{"n": i} for i in range(100, 200)], profile=True)
+    
+    merged = pickle.loads(pickle.dumps(shard_a.profile)).merge(shard_b.profile)
+    n = merged["n"].to_dict()
+    assert n["count"] == 200
+    assert (n["min"], n["max"]) == (0, 199)
+    assert abs(n["distinct_count"] - 200) <= 6
+    assert abs(n["quantiles"][0.5] - 100) <= 2
+
+
+def test_profile_unorderable_values():
+    """Test profiling fields whose values cannot be compared still works."""
+    schema = Schema([
+        Field("meta", DataType.DICT),
+        Field("day", DataType.DATE),
+    ])
+    records = [
+        {"meta": {"a": 1}, "day": "2024-01-01"},
+        {"meta": {"b": 2}, "day": 20240102},
+    ]
+    
+    result = schema.validate_batch(records, profile=True)
+    assert result.valid
+    for name in ("meta", "day"):
+        profile = result.profile[name].to_dict()
+        assert profile["count"] == 2
+        assert (profile["min"], profile["max"]) == (None, None)
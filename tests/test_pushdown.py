@@ -0,0 +1,170 @@
+"""Tests for statistics pushdown helpers."""
+
+import math
+
+import pytest
+
+from pipeval import Schema, Field, DataType, Validators
+from pipeval.readers import FileValidator
+from pipeval.pushdown import numeric_bounds, stats_prove_valid
+
+
+def test_numeric_bounds():
+    """Test bounds are combined from pushdown-able validators."""
+    field = Field("age", DataType.INTEGER, required=True, validators=[
+        Validators.required(),
+        Validators.minimum(0),
+        Validators.range_check(-10, 120),
+    ])
+    assert numeric_bounds(field) == (0, 120)
+    
+    field = Field("age", DataType.INTEGER)
+    assert numeric_bounds(field) == (-math.inf, math.inf)
+
+
+def test_numeric_bounds_not_pushdownable():
+    """Test fields with other checks or types are not pushed down."""
+    field = Field("code", DataType.INTEGER, validators=[Validators.one_of([1, 2])])
+    assert numeric_bounds(field) is None
+    
+    field = Field("name", DataType.STRING)
+    assert numeric_bounds(field) is None
+
+
+def test_stats_prove_valid():
+    """Test min/max/null-count statistics decide only clear cases."""
+    field = Field("age", DataType.INTEGER, required=True, validators=[
+        Validators.range_check(0, 120),
+    ])
+    bounds = numeric_bounds(field)
+    
+    assert stats_prove_valid(field, bounds, "INT64", 100, 0, 1, 99)
+    # Straddles a bound
+    assert not stats_prove_valid(field, bounds, "INT64", 100, 0, -1, 99)
+    # Nulls in a required field
+    assert not stats_prove_valid(field, bounds, "INT64", 100, 3, 1, 99)
+    # Float column truncated by integer conversion
+    assert not stats_prove_valid(field, bounds, "DOUBLE", 100, 0, 1.5, 99.0)
+    # Unknown statistics
+    assert not stats_prove_valid(field, bounds, "INT64", 100, None, 1, 99)
+
+
+def test_stats_prove_valid_beyond_exact_floats():
+    """Test statistics that float() would round are never trusted."""
+    limit = 2 ** 53 + 3
+    field = Field("id", DataType.INTEGER, validators=[Validators.maximum(limit)])
+    bounds = numeric_bounds(field)
+    
+    assert stats_prove_valid(field, bounds, "INT64", 10, 0, 0, 2 ** 53)
+    assert not stats_prove_valid(field, bounds, "INT64", 10, 0, 0, limit)
+    # maximum(2**53 + 3) fails 2**53 + 3 itself once both go through float()
+    assert not Validators.maximum(limit)(float(limit))[0]
+
+
+def test_stats_prove_valid_all_null_optional():
+    """Test an all-null optional column always passes."""
+    field = Field("score", DataType.FLOAT, validators=[Validators.maximum(1)])
+    assert stats_prove_valid(field, numeric_bounds(field), "DOUBLE", 10, 10)
+
+
+def _write_groups(path, pq, groups):
+    import pyarrow as pa
+    
+    rows = [row for group in groups for row in group]
+    table = pa.Table.from_pylist(rows)
+    pq.write_table(table, path, row_group_size=len(groups[0]))
+
+
+def test_validate_parquet_file_statistics(tmp_path, monkeypatch):
+    """Test only unproven row groups and columns are read, with global row numbers."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "data.parquet")
+    groups = [
+        [{"age": 20 + i, "name": "a", "extra": i} for i in range(100)],
+        [{"age": 500 if i == 7 else 30, "name": "b", "extra": i} for i in range(100)],
+        [{"age": 40, "name": "c", "extra": i} for i in range(100)],
+    ]
+    _write_groups(path, pq, groups)
+    schema = Schema([
+        Field("age", DataType.INTEGER, required=True, validators=[Validators.range_check(0, 120)]),
+        Field("name", DataType.STRING, validators=[Validators.one_of(["a", "c"])]),
+    ])
+    
+    reads = []
+    read_row_group = pq.ParquetFile.read_row_group
+    
+    def spy(self, group, columns=None, **kwargs):
+        reads.append((group, columns))
+        return read_row_group(self, group, columns=columns, **kwargs)
+    
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", spy)
+    result = FileValidator.validate_parquet_file(schema, path, use_statistics=True)
+    
+    assert reads == [(0, ["name"]), (1, ["age", "name"]), (2, ["name"])]
+    assert result.records_validated == 300
+    assert [(e.row, e.field) for e in result.errors] == (
+        [(101, "name"), (102, "name"), (103, "name"), (104, "name"), (105, "name"),
+         (106, "name"), (107, "name"), (108, "age")]
+        + [(row, "name") for row in range(108, 201)]
+    )
+
+
+def test_validate_parquet_file_statistics_large_integers(tmp_path):
+    """Test row groups with integers beyond 2**53 are decoded, not skipped."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    pytest.importorskip("pandas")
+    path = str(tmp_path / "data.parquet")
+    _write_groups(path, pq, [[{"id": 1}, {"id": 2 ** 53 + 3}]])
+    schema = Schema([
+        Field("id", DataType.INTEGER, validators=[Validators.maximum(2 ** 53 + 3)]),
+    ])
+    
+    pushed = FileValidator.validate_parquet_file(schema, path, use_statistics=True)
+    full = FileValidator.validate_parquet_file(schema, path)
+    assert len(full.errors) == 1
+    assert [str(e) for e in pushed.errors] == [str(e) for e in full.errors]
+
+
+def test_validate_parquet_file_statistics_matches_full_read(tmp_path):
+    """Test pushdown reports the same errors as decoding every value."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    pytest.importorskip("pandas")
+    path = str(tmp_path / "data.parquet")
+    groups = [
+        [{"n": i, "score": i / 10} for i in range(50)],
+        [{"n": -i, "score": 1.5} for i in range(50)],
+        [{"n": 5, "score": 99.0 if i % 10 == 0 else 2.0} for i in range(50)],
+    ]
+    _write_groups(path, pq, groups)
+    schema = Schema([
+        Field("n", DataType.INTEGER, validators=[Validators.minimum(0)]),
+        Field("score", DataType.FLOAT, validators=[Validators.maximum(10)]),
+    ])
+    
+    pushed = FileValidator.validate_parquet_file(schema, path, use_statistics=True)
+    full = FileValidator.validate_parquet_file(schema, path)
+    
+    assert pushed.records_validated == full.records_validated == 150
+    assert [str(e) for e in pushed.errors] == [str(e) for e in full.errors]
+    assert len(pushed.errors) == 49 + 5
+
+
+def test_validate_parquet_file_statistics_missing_columns(tmp_path, monkeypatch):
+    """Test schema columns absent from the file read as missing values."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "data.parquet")
+    _write_groups(path, pq, [[{"n": 1}] * 10, [{"n": 2}] * 10])
+    
+    optional = Schema([Field("absent", DataType.STRING, validators=[Validators.min_length(3)])])
+    reads = []
+    monkeypatch.setattr(
+        pq.ParquetFile, "read_row_group", lambda self, *a, **k: reads.append(a)
+    )
+    result = FileValidator.validate_parquet_file(optional, path, use_statistics=True)
+    assert result.valid and result.records_validated == 20
+    assert reads == []
+    
+    required = Schema([Field("absent", DataType.STRING, required=True)])
+    result = FileValidator.validate_parquet_file(required, path, use_statistics=True)
+    assert [e.row for e in result.errors] == list(range(1, 21))
+    assert reads == []
@@ -108,3 +108,616 @@ def test_auto_read_unsupported():
     """Test error on unsupported file format."""
     with pytest.raises(ValueError):
         FileReader.auto_read('file.txt')
+
+
+def test_read_jsonl(tmp_path):
+    """Test reading JSON Lines file."""
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1}\n\n{"id": 2}\n')
+    
+    records = FileReader.auto_read(str(path))
+    assert records == [{"id": 1}, {"id": 2}]
+
+
+def test_route_file_csv_to_jsonl(temp_csv_file, tmp_path):
+    """Test routing valid and invalid rows to separate outputs."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("name", DataType.STRING, validators=[Validators.one_of(["Alice"])]),
+    ])
+    valid_path = tmp_path / "valid.jsonl"
+    invalid_path = tmp_path / "invalid.jsonl"
+    
+    result = FileValidator.route_file(
+        schema, temp_csv_file, str(valid_path), str(invalid_path), batch_size=1
+    )
+    assert not result.valid
+    assert result.records_validated == 2
+    
+    valid = FileReader.read_jsonl(str(valid_path))
+    assert valid == [{"id": 1, "name": "Alice"}]
+    
+    invalid = FileReader.read_jsonl(str(invalid_path))
+    assert len(invalid) == 1
+    assert invalid[0]["id"] == "2"
+    assert "Row 2" in invalid[0]["_errors"][0]
+
+
+def test_route_file_csv_outputs(temp_json_file, tmp_path):
+    """Test CSV outputs keep schema columns and annotate errors."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("email", DataType.STRING, validators=[Validators.regex(r"^alice")]),
+    ])
+    valid_path = tmp_path / "valid.csv"
+    invalid_path = tmp_path / "invalid.csv"
+    
+    FileValidator.route_file(schema, temp_json_file, str(valid_path), str(invalid_path))
+    
+    valid = FileReader.read_csv(str(valid_path))
+    assert valid == [{"id": "1", "email": "alice@example.com"}]
+    
+    invalid = FileReader.read_csv(str(invalid_path))
+    assert invalid[0]["name"] == "Bob"
+    assert json.loads(invalid[0]["_errors"])
+
+
+def test_route_file_csv_quarantine_rejects_new_fields(tmp_path):
+    """Test a CSV quarantine never silently drops fields of later rows."""
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": ""}\n{"id": "", "note": "keep me"}\n')
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    
+    with pytest.raises(ValueError, match="note"):
+        FileValidator.route_file(
+            schema, str(path), str(tmp_path / "valid.csv"), str(tmp_path / "invalid.csv")
+        )
+    
+    FileValidator.route_file(
+        schema, str(path), str(tmp_path / "valid.csv"), str(tmp_path / "invalid.jsonl")
+    )
+    invalid = FileReader.read_jsonl(str(tmp_path / "invalid.jsonl"))
+    assert invalid[1]["note"] == "keep me"
+
+
+def test_route_file_csv_quarantine_keeps_extra_values(tmp_path):
+    """Test values beyond the header are written back after it."""
+    path = tmp_path / "data.csv"
+    path.write_text("id,name\n1,Alice\n,Bob,extra\n")
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    invalid_path = tmp_path / "invalid.csv"
+    
+    FileValidator.route_file(schema, str(path), str(tmp_path / "valid.csv"), str(invalid_path))
+    
+    lines = invalid_path.read_text().splitlines()
+    assert lines[0] == "id,name,_errors"
+    assert lines[1].startswith(",Bob,") and lines[1].endswith(",extra")
+
+
+@pytest.fixture
+def large_csv_file(tmp_path):
+    """Create a CSV file where every 10th row has an invalid age."""
+    path = tmp_path / "large.csv"
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'age', 'note'])
+        for i in range(60000):
+            age = 'unknown' if i % 10 == 0 else str(i % 90)
+            note = 'multi\nline' if i % 1000 == 0 else 'x'
+            writer.writerow([i, age, note])
+    return str(path)
+
+
+def test_sample_csv_file(large_csv_file):
+    """Test sampling estimates the error rate from a fraction of the file."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("age", DataType.INTEGER),
+    ])
+    
+    result = FileValidator.sample_file(
+        schema, large_csv_file, confidence=0.95, margin=0.02, seed=7
+    )
+    assert not result.exact
+    assert result.bytes_read < result.bytes_total / 2
+    
+    age = result.field_error_rates["age"]
+    assert age["lower"] <= 0.1 <= age["upper"]
+    assert result.field_error_rates["id"]["rate"] == 0
+    assert result.errors[0].field == "age"
+
+
+def test_sample_csv_keeps_short_rows(tmp_path):
+    """Test sampled short rows count as failures instead of being dropped."""
+    path = tmp_path / "short.csv"
+    with open(path, 'w', newline='') as f:
+        f.write("id,age\n")
+        for i in range(60000):
+            f.write(f"{i}\n" if i % 5 == 0 else f"{i},{i % 90}\n")
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("age", DataType.INTEGER, required=True),
+    ])
+    
+    result = FileValidator.sample_file(schema, str(path), margin=0.02, seed=3)
+    assert not result.exact
+    assert result.sample_size == 2401
+    age = result.field_error_rates["age"]
+    # Short rows follow long lines and are over-picked; unweighted this reads ~22%
+    assert abs(age["rate"] - 0.2) < 0.025
+    assert age["upper"] - age["lower"] < 0.05
+
+
+def test_sample_csv_literal_quotes(tmp_path):
+    """Test a quote inside an unquoted field is read as a literal."""
+    path = tmp_path / "quotes.csv"
+    path.write_text('id,item\n1,5" screen\n2,plain\n3,"quoted, ""x"""\n4,a"b"c\n')
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    
+    result = FileValidator.sample_file(schema, str(path))
+    assert result.exact
+    assert result.sample_size == 4
+    assert result.error_rate["rate"] == 0
+    assert FileReader.read_csv(str(path))[0]["item"] == '5" screen'
+
+
+def test_sample_jsonl_small_file_is_exact(tmp_path):
+    """Test small files are validated in full."""
+    path = tmp_path / "small.jsonl"
+    path.write_text('{"id": 1}\n{"id": "x"}\n{"id": 3}\n{"id": 4}')
+    schema = Schema([Field("id", DataType.INTEGER)])
+    
+    result = FileValidator.sample_file(schema, str(path))
+    assert result.exact
+    assert result.sample_size == 4
+    assert result.error_rate == {"rate": 0.25, "lower": 0.25, "upper": 0.25}
+
+
+def test_sample_jsonl_counts_unparseable_lines(tmp_path):
+    """Test truncated JSONL lines count as failed rows, not skipped ones."""
+    path = tmp_path / "truncated.jsonl"
+    with open(path, 'w') as f:
+        for i in range(50000):
+            f.write(f'{{"id": {i}, "age"\n' if i % 5 == 0 else json.dumps({"id": i}) + "\n")
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    
+    result = FileValidator.sample_file(schema, str(path), margin=0.02, seed=1)
+    assert not result.exact
+    estimate = result.error_rate
+    assert estimate["lower"] <= 0.2 <= estimate["upper"]
+    assert result.field_error_rates["_record"]["rate"] == estimate["rate"]
+    assert result.errors[0].field == "_record"
+    
+    path.write_text('{"id": 1}\n{"id": 2\n[3]\n{"id": 4}\n')
+    small = FileValidator.sample_file(schema, str(path))
+    assert small.exact
+    assert small.error_rate["rate"] == 0.5
+
+
+def test_sample_unsupported_format(temp_json_file):
+    """Test JSON arrays cannot be sampled."""
+    schema = Schema([Field("id", DataType.INTEGER)])
+    with pytest.raises(ValueError):
+        FileValidator.sample_file(schema, temp_json_file)
+
+
+def test_validate_csv_file_resume(tmp_path):
+    """Test an interrupted checkpointed run resumes to the same result."""
+    path = tmp_path / "data.csv"
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'name'])
+        for i in range(1, 101):
+            writer.writerow(['x' if i % 7 == 0 else i, 'multi\nline' if i == 50 else 'n'])
+    checkpoint = str(tmp_path / "progress.ckpt")
+    crashing = [True]
+    
+    def crash_at_row_75(value):
+        if crashing[0] and value == 75:
+            raise RuntimeError("worker died")
+        return True, None
+    
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True, validators=[crash_at_row_75]),
+        Field("name", DataType.STRING),
+    ])
+    with pytest.raises(RuntimeError):
+        FileValidator.validate_csv_file(
+            schema, str(path), checkpoint_path=checkpoint, checkpoint_every=20
+        )
+    assert Path(checkpoint).exists()
+    
+    crashing[0] = False
+    resumed = FileValidator.validate_csv_file(
+        schema, str(path), checkpoint_path=checkpoint, checkpoint_every=20,
+        resume=True
+    )
+    expected = FileValidator.validate_csv_file(schema, str(path))
+    assert resumed.records_validated == expected.records_validated == 100
+    assert [str(e) for e in resumed.errors] == [str(e) for e in expected.errors]
+    assert not Path(checkpoint).exists()
+
+
+def test_validate_csv_file_checkpoint_state(tmp_path):
+    """Test checkpoints are small JSON files and resume restores the profile."""
+    path = tmp_path / "data.csv"
+    with open(path, 'w', newline='') as f:
+        f.write("id,item\n")
+        for i in range(1, 201):
+            f.write(f'{"x" if i % 3 == 0 else i},5" screen\n')
+    checkpoint = tmp_path / "progress.ckpt"
+    stopping = [True]
+    
+    def stop_at_row_140(value):
+        if stopping[0] and value == 140:
+            raise RuntimeError("stopped")
+        return True, None
+    
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True, validators=[stop_at_row_140]),
+        Field("item", DataType.STRING),
+    ])
+    with pytest.raises(RuntimeError):
+        FileValidator.validate_csv_file(
+            schema, str(path), checkpoint_path=str(checkpoint),
+            checkpoint_every=50, profile=True
+        )
+    state = json.loads(checkpoint.read_text())
+    assert state["row"] == 100
+    assert state["error_count"] == 33
+    assert "errors" not in state
+    
+    stopping[0] = False
+    resumed = FileValidator.validate_csv_file(
+        schema, str(path), checkpoint_path=str(checkpoint), checkpoint_every=50,
+        resume=True, profile=True
+    )
+    expected = FileValidator.validate_csv_file(schema, str(path), profile=True)
+    assert [str(e) for e in resumed.errors] == [str(e) for e in expected.errors]
+    assert resumed.profile.to_dict() == expected.profile.to_dict()
+    assert not checkpoint.exists()
+    assert not Path(f"{checkpoint}.errors").exists()
+
+
+def test_validate_csv_file_checkpoint_mismatch(tmp_path):
+    """Test resuming with another schema or a changed file is refused."""
+    path = tmp_path / "data.csv"
+    path.write_text("id,age\n" + "".join(f"{i},{i % 90}\n" for i in range(100)))
+    checkpoint = tmp_path / "progress.ckpt"
+    stopping = [True]
+    
+    def stop_at_row_50(value):
+        if stopping[0] and value == 50:
+            raise RuntimeError("stopped")
+        return True, None
+    
+    schema = Schema([
+        Field("id", DataType.INTEGER, validators=[stop_at_row_50]),
+        Field("age", DataType.INTEGER, validators=[Validators.maximum(80)]),
+    ])
+    with pytest.raises(RuntimeError):
+        FileValidator.validate_csv_file(
+            schema, str(path), checkpoint_path=str(checkpoint), checkpoint_every=10
+        )
+    stopping[0] = False
+    
+    changed = Schema([
+        Field("id", DataType.INTEGER, validators=[stop_at_row_50]),
+        Field("age", DataType.INTEGER, validators=[Validators.maximum(85)]),
+    ])
+    with pytest.raises(ValueError, match="different schema"):
+        FileValidator.validate_csv_file(
+            changed, str(path), checkpoint_path=str(checkpoint), resume=True
+        )
+    
+    with open(path, 'a') as f:
+        f.write("100,10\n")
+    with pytest.raises(ValueError, match="File has changed"):
+        FileValidator.validate_csv_file(
+            schema, str(path), checkpoint_path=str(checkpoint), resume=True
+        )
+
+
+def test_validate_csv_file_rejects_foreign_checkpoint(temp_csv_file, tmp_path):
+    """Test a checkpoint that is not one of ours is refused, not executed."""
+    checkpoint = tmp_path / "progress.ckpt"
+    checkpoint.write_bytes(b"\x80\x04K\x01.")
+    schema = Schema([Field("id", DataType.INTEGER)])
+    
+    with pytest.raises(ValueError, match="checkpoint"):
+        FileValidator.validate_csv_file(
+            schema, temp_csv_file, checkpoint_path=str(checkpoint), resume=True
+        )
+
+
+def test_file_follower_incremental(tmp_path):
+    """Test following validates only newly appended complete records."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.csv"
+    path.write_text("id,name\n1,a\n2,")
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("name", DataType.STRING, required=True),
+    ])
+    follower = FileFollower(schema, str(path))
+    
+    result = follower.poll()
+    assert result.records_validated == 1
+    
+    with open(path, 'a') as f:
+        f.write('b\n3,"multi\n')
+    result = follower.poll()
+    assert result.records_validated == 1
+    assert result.valid
+    
+    with open(path, 'a') as f:
+        f.write('line"\n,c\n')
+    result = follower.poll()
+    assert result.records_validated == 2
+    assert len(result.errors) == 1
+    assert result.errors[0].row == 4
+    assert follower.records_validated == 4
+    
+    assert follower.poll().records_validated == 0
+    follower.close()
+
+
+def test_file_follower_truncation(tmp_path):
+    """Test following restarts after the file is truncated."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id": 1}\n{"id": 2}\n')
+    schema = Schema([Field("id", DataType.INTEGER)])
+    follower = FileFollower(schema, str(path))
+    assert follower.poll().records_validated == 2
+    
+    path.write_text('{"id": "x"}\n')
+    result = follower.poll()
+    assert follower.rotations == 1
+    assert result.records_validated == 1
+    assert result.errors[0].row == 1
+    follower.close()
+
+
+def test_file_follower_rotation_drains_old_file(tmp_path):
+    """Test records appended just before a rotation are still validated."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id": 1}\n')
+    schema = Schema([Field("id", DataType.INTEGER)])
+    with FileFollower(schema, str(path)) as follower:
+        assert follower.poll().records_validated == 1
+        
+        with open(path, 'a') as f:
+            f.write('{"id": "late"}\n')
+        path.rename(tmp_path / "events.jsonl.1")
+        result = follower.poll()
+        assert result.records_validated == 1
+        assert [(e.row, e.value) for e in result.errors] == [(2, "late")]
+        
+        with open(tmp_path / "events.jsonl.1", 'a') as f:
+            f.write('{"id": "later"}\n')
+        path.write_text('{"id": "new"}\n{"id": 2}\n')
+        result = follower.poll()
+        assert follower.rotations == 1
+        assert result.records_validated == 3
+        assert [(e.row, e.value) for e in result.errors] == [(3, "later"), (1, "new")]
+        assert follower.records_validated == 5
+
+
+def test_file_follower_literal_quotes(tmp_path):
+    """Test a mid-field quote does not stall following."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.csv"
+    path.write_text('id,item\n1,5" screen\n')
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    follower = FileFollower(schema, str(path))
+    assert follower.poll().records_validated == 1
+    
+    with open(path, 'a') as f:
+        f.write('2,plain\n,3" cable\n')
+    result = follower.poll()
+    assert result.records_validated == 2
+    assert [e.row for e in result.errors] == [3]
+    follower.close()
+
+
+def test_file_follower_bad_lines(tmp_path):
+    """Test malformed lines are reported without losing the poll's other errors."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id": "x"}\n{"id": \n[1, 2]\n{"id": 4}\n')
+    schema = Schema([Field("id", DataType.INTEGER)])
+    follower = FileFollower(schema, str(path))
+    
+    result = follower.poll()
+    assert result.records_validated == 4
+    assert [(e.row, e.field) for e in result.errors] == [
+        (1, "id"), (2, "_record"), (3, "_record")
+    ]
+    assert follower.poll().records_validated == 0
+    follower.close()
+
+
+def test_follow_file(temp_csv_file):
+    """Test follow_file yields one result per poll."""
+    schema = Schema([Field("id", DataType.INTEGER)])
+    results = list(FileValidator.follow_file(schema, temp_csv_file, interval=0, max_polls=2))
+    assert [r.records_validated for r in results] == [2, 0]
+
+
+def test_read_csv_columns(temp_csv_file):
+    """Test CSV projection by column list and by schema."""
+    records = FileReader.read_csv(temp_csv_file, columns=["email", "id", "missing"])
+    assert records[0] == {"email": "alice@example.com", "id": "1"}
+    
+    schema = Schema([Field("name", DataType.STRING)])
+    records = FileReader.auto_read(temp_csv_file, columns=schema)
+    assert records == [{"name": "Alice"}, {"name": "Bob"}]
+
+
+def test_read_json_columns(temp_json_file, tmp_path):
+    """Test JSON and JSONL projection keeps nested values intact."""
+    records = FileReader.read_json(temp_json_file, columns=["name"])
+    assert records == [{"name": "Alice"}, {"name": "Bob"}]
+    
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1, "meta": {"id": 2, "x": 3}, "wide": 0}\n')
+    records = FileReader.read_jsonl(str(path), columns=["id", "meta"])
+    assert records == [{"id": 1, "meta": {"id": 2, "x": 3}}]
+
+
+def test_validate_file_projects_schema_columns(temp_csv_file):
+    """Test file validation results are unchanged by projection."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("phone", DataType.STRING, required=True),
+    ])
+    result = FileValidator.validate_file(schema, temp_csv_file)
+    assert result.records_validated == 2
+    assert [e.field for e in result.errors] == ["phone", "phone"]
+
+
+def test_route_file_parquet_output_types(tmp_path):
+    """Test Parquet output is typed from the schema, not the first batch."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "data.jsonl"
+    path.write_text("".join(
+        json.dumps({"id": i, "score": None if i < 3 else i / 2}) + "\n" for i in range(6)
+    ))
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("score", DataType.FLOAT),
+    ])
+    valid_path = tmp_path / "valid.parquet"
+    
+    result = FileValidator.route_file(
+        schema, str(path), str(valid_path), str(tmp_path / "invalid.jsonl"), batch_size=2
+    )
+    assert result.valid
+    table = pq.read_table(valid_path)
+    assert str(table.schema.field("score").type) == "double"
+    assert table.num_rows == 6
+    assert pq.ParquetFile(valid_path).metadata.num_row_groups == 3
+    assert table.column("score").to_pylist() == [None, None, None, 1.5, 2.0, 2.5]
+
+
+def test_route_file_parquet_quarantine(tmp_path):
+    """Test quarantined rows with mixed types are written to Parquet as text."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "data.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in [
+        {"id": 1, "age": "x"},
+        {"id": None, "age": 3},
+        {"id": "y", "age": 2.5},
+        {"id": 4, "age": 5},
+    ]))
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("age", DataType.INTEGER),
+    ])
+    
+    for batch_size in (1, 1000):
+        invalid_path = tmp_path / f"invalid{batch_size}.parquet"
+        result = FileValidator.route_file(
+            schema, str(path), str(tmp_path / "valid.parquet"), str(invalid_path),
+            batch_size=batch_size
+        )
+        assert result.records_validated == 4
+        table = pq.read_table(invalid_path)
+        assert table.column("id").to_pylist() == ["1", None, "y"]
+        assert table.column("age").to_pylist() == ["x", "3", "2.5"]
+        assert all(str(f.type) == "string" for f in table.schema)
+    
+    # Outputs that receive no rows are still readable files with the columns
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text(json.dumps({"id": 4, "age": 5}) + "\n")
+    FileValidator.route_file(
+        schema, str(empty), str(tmp_path / "valid.parquet"), str(tmp_path / "none.parquet")
+    )
+    assert pq.read_table(tmp_path / "none.parquet").num_rows == 0
+    path.write_text("")
+    FileValidator.route_file(
+        schema, str(path), str(tmp_path / "valid.parquet"), str(tmp_path / "none.parquet")
+    )
+    valid = pq.read_table(tmp_path / "valid.parquet")
+    assert valid.num_rows == 0
+    assert [str(f.type) for f in valid.schema] == ["int64", "int64"]
+
+
+def test_iter_parquet_columns(tmp_path):
+    """Test streaming Parquet records with column projection."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pylist(
+        [{"id": i, "name": f"n{i}", "wide": "x" * 10} for i in range(25)]
+    ), path)
+    
+    records = list(FileReader.iter_parquet(str(path), batch_size=10, columns=["id", "missing"]))
+    assert records == [{"id": i} for i in range(25)]
+    
+    schema = Schema([Field("id", DataType.INTEGER), Field("name", DataType.STRING)])
+    first = next(FileReader.iter_records(str(path), columns=schema))
+    assert first == {"id": 0, "name": "n0"}
+
+
+def test_validate_parquet_file_missing_columns(tmp_path):
+    """Test rows are still validated when none of the schema's columns exist."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pytest.importorskip("pandas")
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pylist([{"name": f"n{i}"} for i in range(3)]), path)
+    schema = Schema([Field("id", DataType.INTEGER, required=True)])
+    
+    assert FileReader.read_parquet(str(path), columns=schema) == [{}, {}, {}]
+    assert list(FileReader.iter_parquet(str(path), columns=schema)) == [{}, {}, {}]
+    result = FileValidator.validate_parquet_file(schema, str(path))
+    pushed = FileValidator.validate_parquet_file(schema, str(path), use_statistics=True)
+    assert result.records_validated == pushed.records_validated == 3
+    assert [str(e) for e in result.errors] == [str(e) for e in pushed.errors]
+    assert [e.message for e in result.errors] == ["Required field"] * 3
+
+
+def test_sample_parquet_row_groups(tmp_path):
+    """Test Parquet sampling reads whole random row groups until the target."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "data.parquet"
+    rows = [{"age": -1 if i % 4 == 0 else 30} for i in range(20000)]
+    pq.write_table(pa.Table.from_pylist(rows), path, row_group_size=1000)
+    schema = Schema([Field("age", DataType.INTEGER, validators=[Validators.minimum(0)])])
+    
+    result = FileValidator.sample_file(schema, str(path), margin=0.02, seed=1)
+    assert not result.exact
+    assert result.sample_size == 3000
+    assert result.error_rate["rate"] == 0.25
+    
+    assert result.bytes_read < result.bytes_total
+    
+    small = FileValidator.sample_file(schema, str(path), margin=0.005, seed=1)
+    assert small.exact
+    assert small.sample_size == 20000
+
+
+def test_sample_parquet_bounds_cover_clustered_errors(tmp_path):
+    """Test Parquet bounds account for rows of a row group not being independent."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "clustered.parquet"
+    # One row group of 20 is all bad: the true rate is 5%
+    rows = [{"age": -1 if i < 500 else 30} for i in range(10000)]
+    pq.write_table(pa.Table.from_pylist(rows), path, row_group_size=500)
+    schema = Schema([Field("age", DataType.INTEGER, validators=[Validators.minimum(0)])])
+    
+    for seed in range(20):
+        result = FileValidator.sample_file(schema, str(path), margin=0.05, seed=seed)
+        assert not result.exact
+        estimate = result.error_rate
+        assert estimate["lower"] <= 0.05 <= estimate["upper"]
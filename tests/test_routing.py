@@ -0,0 +1,196 @@
+"""Tests for discriminator-based schema routing."""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from pipeval import Schema, SchemaRouter, Field, DataType, Validators
+from pipeval.readers import FileReader, FileValidator
+from pipeval.sqlite import SQLiteValidator
+
+
+def make_router():
+    return SchemaRouter("type", {
+        "click": Schema([
+            Field("x", DataType.INTEGER, required=True),
+        ]),
+        "view": Schema([
+            Field("page", DataType.STRING, validators=[Validators.regex(r"^/")]),
+        ]),
+    })
+
+
+RECORDS = [
+    {"type": "click", "x": "10"},
+    {"type": "view", "page": "/home"},
+    {"type": "click", "x": ""},
+    {"type": "view", "page": "home"},
+    {"type": "scroll", "dy": 3},
+    {"type": "view", "page": "/about"},
+]
+
+
+def test_router_validate_batch():
+    """Test per-type results from one mixed batch."""
+    result = make_router().validate_batch(RECORDS)
+    
+    assert not result.valid
+    assert result.records_validated == 6
+    assert [(e.row, e.record_type, e.field) for e in result.errors] == [
+        (3, "click", "x"), (4, "view", "page"), (5, "scroll", "type")
+    ]
+    assert result.by_type["view"].records_validated == 3
+    assert len(result.by_type["view"].errors) == 1
+    assert result.to_dict()["by_type"]["click"]["error_count"] == 1
+
+
+def test_router_default_schema():
+    """Test unknown types fall back to the default schema."""
+    router = SchemaRouter("type", {}, default=Schema([Field("id", DataType.INTEGER)]))
+    errors, converted = router.validate_record({"type": "any", "id": "5"})
+    assert errors == []
+    assert converted == {"id": 5, "type": "any"}
+
+
+def test_router_avalidate_stream():
+    """Test routing in the async path reports per-type counts."""
+    async def source():
+        for record in RECORDS:
+            yield record
+    
+    result = asyncio.run(make_router().avalidate_stream(source(), batch_size=2))
+    assert result.records_validated == 6
+    assert result.by_type["click"].records_validated == 2
+    assert result.by_type["scroll"].errors[0].message == "Unknown record type 'scroll'"
+
+
+def test_router_file_paths(tmp_path):
+    """Test routers plug into the file validators."""
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in RECORDS))
+    
+    result = FileValidator.validate_file(make_router(), str(path))
+    assert result.by_type["view"].records_validated == 3
+    
+    valid_path = tmp_path / "valid.jsonl"
+    routed = FileValidator.route_file(
+        make_router(), str(path), str(valid_path), str(tmp_path / "bad.jsonl")
+    )
+    valid = FileReader.read_jsonl(str(valid_path))
+    assert [r["type"] for r in valid] == ["click", "view", "view"]
+    assert _type_summary(routed) == _type_summary(result)
+
+
+def _type_summary(result):
+    return {
+        record_type: (r.records_validated, len(r.errors))
+        for record_type, r in result.by_type.items()
+    }
+
+
+def test_router_streaming_paths(tmp_path):
+    """Test checkpointed and followed validation report results per type."""
+    from pipeval.readers import FileFollower
+    
+    path = tmp_path / "events.csv"
+    path.write_text("type,x,page\n" + "".join(
+        f"{r['type']},{r.get('x', '')},{r.get('page', '')}\n" for r in RECORDS
+    ) * 10)
+    expected = _type_summary(FileValidator.validate_csv_file(make_router(), str(path)))
+    assert expected["view"] == (30, 10)
+    
+    checkpoint = str(tmp_path / "progress.ckpt")
+    interrupted = [True]
+    
+    def stop_once(value):
+        if interrupted[0] and value == "/about":
+            interrupted[0] = False
+            raise RuntimeError("stopped")
+        return True, None
+    
+    router = SchemaRouter("type", {
+        "click": Schema([Field("x", DataType.INTEGER, required=True)]),
+        "view": Schema([
+            Field("page", DataType.STRING, validators=[Validators.regex(r"^/"), stop_once]),
+        ]),
+    })
+    with pytest.raises(RuntimeError):
+        FileValidator.validate_csv_file(
+            router, str(path), checkpoint_path=checkpoint, checkpoint_every=4
+        )
+    resumed = FileValidator.validate_csv_file(
+        router, str(path), checkpoint_path=checkpoint, checkpoint_every=4, resume=True
+    )
+    assert _type_summary(resumed) == expected
+    
+    with FileFollower(make_router(), str(path)) as follower:
+        assert _type_summary(follower.poll()) == expected
+        with open(path, 'a') as f:
+            f.write("view,,home\n")
+        assert _type_summary(follower.poll()) == {"view": (1, 1)}
+
+
+def test_router_conflicting_fields_parquet(tmp_path):
+    """Test a field typed differently per record type is written as text."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    router = SchemaRouter("type", {
+        "a": Schema([Field("x", DataType.INTEGER)]),
+        "b": Schema([Field("x", DataType.STRING), Field("n", DataType.INTEGER)]),
+    })
+    assert router.conflicting_fields == {"x"}
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        '{"type": "a", "x": "1"}\n{"type": "b", "x": "hello", "n": 2}\n'
+    )
+    
+    result = FileValidator.route_file(
+        router, str(path), str(tmp_path / "valid.parquet"), str(tmp_path / "bad.jsonl")
+    )
+    assert result.valid
+    table = pq.read_table(tmp_path / "valid.parquet")
+    assert table.column("x").to_pylist() == ["1", "hello"]
+    assert str(table.schema.field("n").type) == "int64"
+
+
+def test_router_profile_and_unhashable_types():
+    """Test profiling mixed types and discriminators that are lists or objects."""
+    records = RECORDS + [
+        {"type": "view", "page": "/x", "x": "1"},
+        {"type": ["click"], "x": "1"},
+        {"type": {"kind": "view"}},
+    ]
+    result = make_router().validate_batch(records, profile=True)
+    
+    assert [(e.row, e.field) for e in result.errors[-2:]] == [(8, "type"), (9, "type")]
+    assert "scalar, not list" in result.errors[-2].message
+    assert result.by_type[None].records_validated == 2
+    x = result.profile["x"].to_dict()
+    assert (x["count"], x["invalid_count"]) == (2, 1)
+
+
+def test_router_sqlite_dispatch():
+    """Test SQLite pushdown checks each row against its own type's schema."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (type TEXT, x, page)")
+    conn.executemany("INSERT INTO events VALUES (?, ?, ?)", [
+        (r["type"], r.get("x"), r.get("page")) for r in RECORDS
+    ] + [("view", None, "/a"), (None, 1, None), (1, 2, None)])
+    
+    result = SQLiteValidator.validate_table(make_router(), conn, "events")
+    cursor = conn.execute("SELECT * FROM events")
+    names = [d[0] for d in cursor.description]
+    expected = make_router().validate_batch([dict(zip(names, r)) for r in cursor])
+    
+    assert [str(e) for e in result.errors] == [str(e) for e in expected.errors]
+    assert [e.row for e in result.errors] == [3, 4, 5, 8, 9]
+    assert _type_summary(result) == _type_summary(expected)
+
+
+def test_router_parquet_statistics_rejected(tmp_path):
+    """Test statistics pushdown refuses a router instead of mixing types."""
+    with pytest.raises(ValueError, match="SchemaRouter"):
+        FileValidator.validate_parquet_file(
+            make_router(), str(tmp_path / "events.parquet"), use_statistics=True
+        )
@@ -0,0 +1,109 @@
+"""Tests for the validation server."""
+
+import asyncio
+import json
+
+from pipeval import Schema, Field, DataType
+from pipeval.server import ValidationServer
+from pipeval.loadtest import run_load_test
+
+
+def explode(value):
+    raise RuntimeError("validator bug")
+
+
+SCHEMAS = {
+    "users": Schema([Field("id", DataType.INTEGER, required=True)]),
+    "broken": Schema([Field("id", DataType.INTEGER, validators=[explode])]),
+}
+
+
+async def request(reader, writer, method, path, payload=None, close=False):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write((
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"{'Connection: close' + chr(13) + chr(10) if close else ''}\r\n"
+    ).encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    data = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(data)
+
+
+def run_with_server(client, **server_kwargs):
+    async def main():
+        server = ValidationServer(SCHEMAS, port=0, **server_kwargs)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            try:
+                return await client(reader, writer)
+            finally:
+                writer.close()
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+def test_validate_batches_over_keep_alive():
+    """Test several batches on one connection get compact results."""
+    async def client(reader, writer):
+        first = await request(reader, writer, "POST", "/validate/users", [{"id": 1}])
+        second = await request(
+            reader, writer, "POST", "/validate/users", {"records": [{"id": 1}, {"id": ""}]},
+            close=True
+        )
+        return first, second
+    
+    first, second = run_with_server(client)
+    assert first[0] == 200
+    assert first[1]["connection"] == "keep-alive"
+    assert first[2] == {"valid": True, "records": 1, "error_count": 0, "errors": []}
+    assert second[2]["errors"] == [[2, "id", "Required field"]]
+    assert second[1]["connection"] == "close"
+
+
+def test_server_errors():
+    """Test unknown schemas and malformed bodies."""
+    async def client(reader, writer):
+        missing = await request(reader, writer, "POST", "/validate/nope", [])
+        writer.write(b"POST /validate/users HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x]")
+        await writer.drain()
+        bad_status = (await reader.readline()).split()[1]
+        return missing[0], bad_status
+    
+    missing, bad = run_with_server(client)
+    assert missing == 404
+    assert bad == b"400"
+
+
+def test_load_test_reports_latency():
+    """Test the bundled load test against an in-process server."""
+    stats = asyncio.run(run_load_test(requests=20, concurrency=2, batch_size=5))
+    assert stats["requests"] == 20
+    assert stats["p99_ms"] >= stats["p50_ms"] > 0
+
+
+def test_server_bad_records_and_failures():
+    """Test non-object records get 400 and validator failures 500, keeping the connection."""
+    async def client(reader, writer):
+        not_objects = await request(reader, writer, "POST", "/validate/users", [[1, 2]])
+        failed = await request(reader, writer, "POST", "/validate/broken", [{"id": 1}])
+        large = await request(reader, writer, "POST", "/validate/users", [{"id": 1}] * 50)
+        return not_objects, failed, large
+    
+    not_objects, failed, large = run_with_server(client, executor_body_size=100)
+    assert not_objects[0] == 400
+    assert "Record 0" in not_objects[2]["error"]
+    assert failed[0] == 500
+    assert "validator bug" in failed[2]["error"]
+    assert failed[1]["connection"] == "keep-alive"
+    assert large[0] == 200 and large[2]["records"] == 50
@@ -0,0 +1,131 @@
+"""Tests for SQLite pushdown validation."""
+
+import sqlite3
+
+import pytest
+from pipeval import Schema, Field, DataType, Validators
+from pipeval.sqlite import SQLiteValidator, suspect_predicate
+
+
+@pytest.fixture
+def conn():
+    """Create an in-memory table with a mix of clean and dirty rows."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id, age, status, name, email, extra)")
+    rows = [
+        (1, 30, "active", "alice", "alice@example.com", "x"),
+        (2, 200, "active", "bob", "bob@example.com", "x"),
+        (3, "41", "pending", "carol", "carol@example.com", "x"),
+        (None, 25, "active", "d", "not-an-email", "x"),
+        (5, 12.7, "inactive", "", None, "x"),
+        (6, "abc", "active", "frank", "frank@example.com", "x"),
+    ]
+    conn.executemany("INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)", rows)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def schema():
+    return Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("age", DataType.INTEGER, validators=[Validators.range_check(0, 150)]),
+        Field("status", DataType.STRING, validators=[
+            Validators.one_of(["active", "inactive"]),
+        ]),
+        Field("name", DataType.STRING, validators=[Validators.min_length(2)]),
+        Field("email", DataType.STRING, validators=[Validators.email()]),
+        Field("country", DataType.STRING),
+    ])
+
+
+def test_validate_table_matches_python(conn, schema):
+    """Test pushdown reports exactly what validate_batch would."""
+    cursor = conn.execute("SELECT * FROM users")
+    names = [d[0] for d in cursor.description]
+    expected = schema.validate_batch([dict(zip(names, r)) for r in cursor.fetchall()])
+    
+    result = SQLiteValidator.validate_table(schema, conn, "users", batch_size=2)
+    assert result.records_validated == 6
+    assert [str(e) for e in result.errors] == [str(e) for e in expected.errors]
+
+
+def test_validate_table_pushdown(conn):
+    """Test a fully pushed-down schema finds offending rows."""
+    schema = Schema([
+        Field("id", DataType.INTEGER, required=True),
+        Field("age", DataType.INTEGER, validators=[Validators.maximum(150)]),
+    ])
+    
+    result = SQLiteValidator.validate_table(schema, conn, "users")
+    assert [(e.row, e.field) for e in result.errors] == [
+        (2, "age"), (4, "id"), (6, "age")
+    ]
+
+
+def test_validate_table_conversion_edge_cases():
+    """Test values SQL cannot convert like Python are never missed."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (flag, big, wide, label)")
+    rows = [
+        (1, 5, 5.0, "ok"),
+        ("maybe", 1e20, 9007199254740995, "ok"),
+        (5, 2 ** 62, 1.0, "abc\x00defgh"),
+        ("TRUE", -1e20, 2.0, "ok"),
+        (1.0, 7, 3.0, "ok"),
+        ("no", 8, 4.0, None),
+    ]
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?)", rows)
+    schema = Schema([
+        Field("flag", DataType.BOOLEAN),
+        Field("big", DataType.INTEGER, validators=[Validators.range_check(-1e19, 1e19)]),
+        Field("wide", DataType.FLOAT, validators=[Validators.maximum(9007199254740995)]),
+        Field("label", DataType.STRING, validators=[Validators.max_length(5)]),
+    ])
+    
+    cursor = conn.execute("SELECT * FROM t")
+    names = [d[0] for d in cursor.description]
+    expected = schema.validate_batch([dict(zip(names, r)) for r in cursor.fetchall()])
+    result = SQLiteValidator.validate_table(schema, conn, "t")
+    
+    assert [str(e) for e in result.errors] == [str(e) for e in expected.errors]
+    assert [(e.row, e.field) for e in result.errors] == [
+        (2, "flag"), (2, "big"), (2, "wide"),
+        (3, "flag"), (3, "label"),
+        (4, "big"),
+        (5, "flag"),
+    ]
+
+
+def test_validate_table_clean_rows_not_fetched(conn):
+    """Test no rows are fetched when the aggregate query finds nothing."""
+    queries = []
+    conn.set_trace_callback(queries.append)
+    schema = Schema([
+        Field("extra", DataType.STRING, required=True, validators=[
+            Validators.one_of(["x"]),
+        ]),
+    ])
+    
+    result = SQLiteValidator.validate_table(schema, conn, "users")
+    assert result.valid
+    assert result.records_validated == 6
+    assert not any("ROW_NUMBER" in q for q in queries)
+
+
+def test_suspect_predicate():
+    """Test which fields can be pushed down."""
+    field = Field("n", DataType.INTEGER)
+    assert "typeof" in suspect_predicate(field, '"n"')[0]
+    
+    field = Field("s", DataType.STRING)
+    assert suspect_predicate(field, '"s"') is None
+    
+    field = Field("s", DataType.STRING, required=True, validators=[Validators.regex("^a")])
+    assert suspect_predicate(field, '"s"') == ("1", [])
+
+
+def test_validate_table_missing(conn, schema):
+    """Test unknown tables raise."""
+    with pytest.raises(ValueError):
+        SQLiteValidator.validate_table(schema, conn, "nope")